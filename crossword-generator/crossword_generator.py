@@ -9,21 +9,45 @@ import argparse
 import json
 import random
 import sys
+from array import array
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import (
+    AbstractSet,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from extract_clues import build_master_clue_list
 from tqdm import tqdm
 
+try:
+    import orjson  # Optional: much faster loading of master_clues.json
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-class Direction(Enum):
-    ACROSS = "across"
-    DOWN = "down"
 
+# Use __slots__ for the grid dataclasses where supported (Python 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+class Direction(IntEnum):
+    ACROSS = 0
+    DOWN = 1
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Word:
     text: str
     row: int
@@ -33,18 +57,22 @@ class Word:
     quality: int = 2  # Default to quality 2 for backwards compatibility
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CrosswordGrid:
     width: int = 5
     height: int = 5
     grid: List[List[str]] = None
     words: List[Word] = None
     # Cache for expensive calculations
-    _cached_sequences: List[Tuple[str, int, int, Direction]] = None
-    _cached_placed_words: Set[Tuple[str, int, int, Direction]] = None
-    _cached_used_answers: Set[str] = None
-    _cached_empty_squares: int = None
-    _cached_invalid_sequences: int = None
+    _cached_sequences: Optional[List[Tuple[str, int, int, Direction]]] = None
+    _cached_placed_words: Optional[Set[Tuple[str, int]]] = None
+    _cached_used_answers: Optional[FrozenSet[str]] = None
+    _cached_empty_squares: Optional[int] = None
+    _cached_consecutive_violations: Optional[int] = None
+    _cached_invalid_sequences: Optional[int] = None
+    _cached_invalid_answers_id: Optional[int] = None
+    _cached_final_words: Optional[List[Word]] = None
+    _cached_final_words_key: Optional[Tuple[int, int]] = None
 
     def __post_init__(self):
         if self.grid is None:
@@ -60,7 +88,11 @@ class CrosswordGrid:
         self._cached_placed_words = None
         self._cached_used_answers = None
         self._cached_empty_squares = None
+        self._cached_consecutive_violations = None
         self._cached_invalid_sequences = None
+        self._cached_invalid_answers_id = None
+        self._cached_final_words = None
+        self._cached_final_words_key = None
 
     @property
     def size(self):
@@ -73,7 +105,7 @@ class CrosswordGrid:
         row: int,
         col: int,
         direction: Direction,
-        available_answers: Set[str] = None,
+        available_answers: Optional[AbstractSet[str]] = None,
     ) -> bool:
         """Check if a word can be placed at the given position."""
         if direction == Direction.ACROSS:
@@ -111,120 +143,92 @@ class CrosswordGrid:
             # This avoids the expensive temporary object creation and method calls
             
             # Check for new sequences that would be created by this word placement
-            new_sequences = self._get_new_sequences_from_placement(word, row, col, direction)
+            # Only sequences of 3+ letters are validated, so shorter ones are never built,
+            # and sequences matching already placed words are excluded by the helper
+            # Sequences are produced lazily, so we stop at the first invalid one
+            new_sequences = self._iter_new_sequences_from_placement(
+                word, row, col, direction, min_length=3
+            )
             
             # Check if any new sequences are invalid
             for sequence, seq_row, seq_col, seq_direction in new_sequences:
-                # Only validate sequences of 3+ letters that are not already placed words
-                if len(sequence) >= 3:
-                    # Check if this sequence corresponds to an already placed word
-                    is_placed_word = False
-                    for existing_word in self.words:
-                        if (existing_word.text == sequence and 
-                            existing_word.row == seq_row and 
-                            existing_word.col == seq_col and 
-                            existing_word.direction == seq_direction):
-                            is_placed_word = True
-                            break
-                    
-                    if not is_placed_word and sequence not in available_answers:
-                        return False
+                if sequence not in available_answers:
+                    return False
 
         return True
 
-    def _get_new_sequences_from_placement(
-        self, word: str, row: int, col: int, direction: Direction
-    ) -> List[Tuple[str, int, int, Direction]]:
-        """Get new letter sequences that would be created by placing a word.
+    def _iter_new_sequences_from_placement(
+        self, word: str, row: int, col: int, direction: Direction, min_length: int = 2
+    ) -> Iterator[Tuple[str, int, int, Direction]]:
+        """Yield new letter sequences that would be created by placing a word.
         
         This is an optimized version that directly analyzes the grid without
         creating temporary objects, avoiding the expensive temporary grid creation.
+        Sequences shorter than min_length are skipped before their text is built.
         """
-        new_sequences = []
+        placed_words = self.get_placed_words_set()
+        grid = self.grid
         
         if direction == Direction.ACROSS:
             # Check for new vertical sequences that would be created
+            last_row = self.height - 1
             for i, char in enumerate(word):
                 word_col = col + i
-                word_row = row
                 
                 # Find the start of any vertical sequence at this position
-                start_row = word_row
-                while (start_row > 0 and 
-                       self.grid[start_row - 1][word_col] != "."):
+                start_row = row
+                while start_row > 0 and grid[start_row - 1][word_col] != ".":
                     start_row -= 1
                 
                 # Find the end of any vertical sequence at this position
-                end_row = word_row
-                while (end_row < self.height - 1 and 
-                       self.grid[end_row + 1][word_col] != "."):
+                end_row = row
+                while end_row < last_row and grid[end_row + 1][word_col] != ".":
                     end_row += 1
                 
-                # If we have a sequence of 2+ characters, check if it's new
-                if end_row - start_row + 1 >= 2:
+                # If we have a long enough sequence, check if it's new
+                if end_row - start_row + 1 >= min_length:
                     # Build the sequence
                     sequence = ""
                     for r in range(start_row, end_row + 1):
-                        if r == word_row:
+                        if r == row:
                             sequence += char  # Use the new character
                         else:
-                            sequence += self.grid[r][word_col]
-                    
-                    # Only add if it's a new sequence (not already a placed word)
-                    is_existing_word = False
-                    for existing_word in self.words:
-                        if (existing_word.direction == Direction.DOWN and
-                            existing_word.row == start_row and
-                            existing_word.col == word_col and
-                            existing_word.text == sequence):
-                            is_existing_word = True
-                            break
+                            sequence += grid[r][word_col]
                     
-                    if not is_existing_word:
-                        new_sequences.append((sequence, start_row, word_col, Direction.DOWN))
+                    # Only yield if it's a new sequence (not already a placed word)
+                    if self._key(sequence, start_row, word_col, Direction.DOWN) not in placed_words:
+                        yield (sequence, start_row, word_col, Direction.DOWN)
         
         else:  # DOWN
             # Check for new horizontal sequences that would be created
+            last_col = self.width - 1
             for i, char in enumerate(word):
                 word_row = row + i
-                word_col = col
+                grid_row = grid[word_row]
                 
                 # Find the start of any horizontal sequence at this position
-                start_col = word_col
-                while (start_col > 0 and 
-                       self.grid[word_row][start_col - 1] != "."):
+                start_col = col
+                while start_col > 0 and grid_row[start_col - 1] != ".":
                     start_col -= 1
                 
                 # Find the end of any horizontal sequence at this position
-                end_col = word_col
-                while (end_col < self.width - 1 and 
-                       self.grid[word_row][end_col + 1] != "."):
+                end_col = col
+                while end_col < last_col and grid_row[end_col + 1] != ".":
                     end_col += 1
                 
-                # If we have a sequence of 2+ characters, check if it's new
-                if end_col - start_col + 1 >= 2:
+                # If we have a long enough sequence, check if it's new
+                if end_col - start_col + 1 >= min_length:
                     # Build the sequence
                     sequence = ""
                     for c in range(start_col, end_col + 1):
-                        if c == word_col:
+                        if c == col:
                             sequence += char  # Use the new character
                         else:
-                            sequence += self.grid[word_row][c]
+                            sequence += grid_row[c]
                     
-                    # Only add if it's a new sequence (not already a placed word)
-                    is_existing_word = False
-                    for existing_word in self.words:
-                        if (existing_word.direction == Direction.ACROSS and
-                            existing_word.row == word_row and
-                            existing_word.col == start_col and
-                            existing_word.text == sequence):
-                            is_existing_word = True
-                            break
-                    
-                    if not is_existing_word:
-                        new_sequences.append((sequence, word_row, start_col, Direction.ACROSS))
-        
-        return new_sequences
+                    # Only yield if it's a new sequence (not already a placed word)
+                    if self._key(sequence, word_row, start_col, Direction.ACROSS) not in placed_words:
+                        yield (sequence, word_row, start_col, Direction.ACROSS)
 
     def place_word(
         self,
@@ -252,11 +256,7 @@ class CrosswordGrid:
         if self._cached_empty_squares is not None:
             return self._cached_empty_squares
         
-        count = 0
-        for row in self.grid:
-            for cell in row:
-                if cell == ".":
-                    count += 1
+        count = sum(row.count(".") for row in self.grid)
         self._cached_empty_squares = count
         return count
 
@@ -276,6 +276,9 @@ class CrosswordGrid:
         Returns:
             Number of violations found in the grid.
         """
+        if self._cached_consecutive_violations is not None:
+            return self._cached_consecutive_violations
+
         max_consecutive = max(self.width, self.height) // 2
         violations = 0
 
@@ -301,14 +304,15 @@ class CrosswordGrid:
                 else:
                     consecutive_empty = 0
 
+        self._cached_consecutive_violations = violations
         return violations
 
-    def get_used_answers(self) -> Set[str]:
+    def get_used_answers(self) -> FrozenSet[str]:
         """Get set of all answers used in this crossword."""
         if self._cached_used_answers is not None:
             return self._cached_used_answers
         
-        self._cached_used_answers = {word.text for word in self.words}
+        self._cached_used_answers = frozenset(word.text for word in self.words)
         return self._cached_used_answers
 
     def get_all_letter_sequences(self) -> List[Tuple[str, int, int, Direction]]:
@@ -353,21 +357,27 @@ class CrosswordGrid:
         self._cached_sequences = sequences
         return sequences
 
-    def get_placed_words_set(self) -> Set[Tuple[str, int, int, Direction]]:
-        """Get set of all placed words as (text, row, col, direction) tuples."""
+    def _key(self, text: str, row: int, col: int, direction: Direction) -> Tuple[str, int]:
+        """Build a compact placed-word key: the text plus one packed position int."""
+        return (text, (row * self.width + col) * 2 + direction)
+
+    def get_placed_words_set(self) -> Set[Tuple[str, int]]:
+        """Get set of all placed words as keys built by `_key`."""
         if self._cached_placed_words is not None:
             return self._cached_placed_words
         
-        self._cached_placed_words = {(word.text, word.row, word.col, word.direction) for word in self.words}
+        self._cached_placed_words = {
+            self._key(word.text, word.row, word.col, word.direction) for word in self.words
+        }
         return self._cached_placed_words
 
-    def count_invalid_sequences(self, available_answers: Set[str]) -> int:
+    def count_invalid_sequences(self, available_answers: AbstractSet[str]) -> int:
         """Count number of invalid letter sequences in the grid."""
         # Use a cache key that includes available_answers to avoid conflicts
         cache_key = id(available_answers)  # Use object id as cache key
-        if hasattr(self, '_cached_invalid_sequences') and hasattr(self, '_cached_invalid_answers_id'):
-            if self._cached_invalid_answers_id == cache_key:
-                return self._cached_invalid_sequences
+        if (self._cached_invalid_answers_id == cache_key
+                and self._cached_invalid_sequences is not None):
+            return self._cached_invalid_sequences
         
         all_sequences = self.get_all_letter_sequences()
         placed_words = self.get_placed_words_set()
@@ -375,7 +385,7 @@ class CrosswordGrid:
 
         for sequence, row, col, direction in all_sequences:
             # Check if this sequence corresponds to a placed word
-            if (sequence, row, col, direction) not in placed_words:
+            if self._key(sequence, row, col, direction) not in placed_words:
                 # This is an unintended word - check if it's valid
                 # Only validate sequences of 2+ letters
                 if len(sequence) >= 2 and sequence not in available_answers:
@@ -387,28 +397,39 @@ class CrosswordGrid:
 
     def process_unintended_sequences(
         self,
-        available_answers: Set[str],
+        available_answers: AbstractSet[str],
         clue_lookup: dict,
-        clue_list: List[Tuple[str, str, int]] = None,
+        clue_list: Optional[List[Tuple[str, str, int]]] = None,
+        quality_lookup: Optional[dict] = None,
     ) -> List[Word]:
         """Process unintended sequences and return updated word list with valid sequences added and overlapping clues removed."""
+        # Scoring and display ask for the final words of the same grid several times
+        cache_key = (id(available_answers), id(clue_lookup))
+        if self._cached_final_words_key == cache_key and self._cached_final_words is not None:
+            return self._cached_final_words
+
+        if quality_lookup is None:
+            # Fall back to building the lookup from clue_list; the first entry for an answer wins
+            quality_lookup = {}
+            for clue_text, answer, q in clue_list or ():
+                quality_lookup.setdefault(answer, q)
+
         all_sequences = self.get_all_letter_sequences()
         placed_words = self.get_placed_words_set()
         unintended_sequences = []
 
         # Find all unintended sequences that are valid words
         for sequence, row, col, direction in all_sequences:
-            if (sequence, row, col, direction) not in placed_words:
+            if self._key(sequence, row, col, direction) not in placed_words:
                 if len(sequence) >= 3 and sequence in available_answers:
+                    # Swap in the canonical answer string so the new Word shares it
+                    sequence = sys.intern(sequence)
                     # Find a clue and quality for this sequence
-                    clue = clue_lookup.get(sequence, f"Unknown word: {sequence}")
-                    # Look up the actual quality from the clue list
-                    quality = 2  # Default fallback
-                    if clue_list:
-                        for clue_text, answer, q in clue_list:
-                            if answer == sequence:
-                                quality = q
-                                break
+                    clue = clue_lookup.get(sequence)
+                    if clue is None:
+                        clue = f"Unknown word: {sequence}"
+                    # Look up the actual quality, defaulting to 2
+                    quality = quality_lookup.get(sequence, 2)
                     unintended_sequences.append(
                         Word(sequence, row, col, direction, clue, quality)
                     )
@@ -420,36 +441,31 @@ class CrosswordGrid:
         for seq_word in unintended_sequences:
             updated_words.append(seq_word)
 
-        # Remove words that are substrings of longer valid sequences
-        words_to_remove = []
+        # Index words by starting cell so each word is only compared against the
+        # perpendicular words that start inside its span
+        words_by_start: Dict[Tuple[int, int, Direction], List[Word]] = {}
         for word in updated_words:
-            for other_word in updated_words:
-                if (
-                    word != other_word
-                    and word.text in other_word.text
-                    and len(word.text) < len(other_word.text)
-                    and
-                    # Check if they overlap in the grid
-                    self._words_overlap(word, other_word)
-                ):
-                    words_to_remove.append(word)
-                    break
+            key = (word.row, word.col, word.direction)
+            words_by_start.setdefault(key, []).append(word)
 
-        # Remove the overlapping words
-        final_words = [w for w in updated_words if w not in words_to_remove]
+        # Remove words that are substrings of longer valid sequences
+        final_words = [w for w in updated_words if not self._is_covered(w, words_by_start)]
 
+        self._cached_final_words = final_words
+        self._cached_final_words_key = cache_key
         return final_words
 
     def get_final_word_count(
         self,
-        available_answers: Set[str] = None,
-        clue_lookup: dict = None,
-        clue_list: List[Tuple[str, str, int]] = None,
+        available_answers: Optional[AbstractSet[str]] = None,
+        clue_lookup: Optional[dict] = None,
+        clue_list: Optional[List[Tuple[str, str, int]]] = None,
+        quality_lookup: Optional[dict] = None,
     ) -> int:
         """Get the total word count including unintended sequences that become valid words."""
         if available_answers is not None and clue_lookup is not None:
             final_words = self.process_unintended_sequences(
-                available_answers, clue_lookup, clue_list
+                available_answers, clue_lookup, clue_list, quality_lookup
             )
             return len(final_words)
         else:
@@ -457,53 +473,48 @@ class CrosswordGrid:
 
     def get_final_words(
         self,
-        available_answers: Set[str] = None,
-        clue_lookup: dict = None,
-        clue_list: List[Tuple[str, str, int]] = None,
+        available_answers: Optional[AbstractSet[str]] = None,
+        clue_lookup: Optional[dict] = None,
+        clue_list: Optional[List[Tuple[str, str, int]]] = None,
+        quality_lookup: Optional[dict] = None,
     ) -> List[Word]:
         """Get the final word list including unintended sequences that become valid words."""
         if available_answers is not None and clue_lookup is not None:
             return self.process_unintended_sequences(
-                available_answers, clue_lookup, clue_list
+                available_answers, clue_lookup, clue_list, quality_lookup
             )
         else:
             return self.words
 
-    def _words_overlap(self, word1: Word, word2: Word) -> bool:
-        """Check if two words overlap in the grid."""
-        if word1.direction == word2.direction:
-            return False  # Same direction words don't overlap
-
-        if word1.direction == Direction.ACROSS:
-            # word1 is across, word2 is down
-            return (
-                word1.row == word2.row
-                and word2.col >= word1.col
-                and word2.col < word1.col + len(word1.text)
-            )
-        else:
-            # word1 is down, word2 is across
-            return (
-                word1.col == word2.col
-                and word2.row >= word1.row
-                and word2.row < word1.row + len(word1.text)
-            )
+    def _is_covered(self, word: Word, words_by_start: dict) -> bool:
+        """Check if a longer perpendicular word starting inside this word's span contains it."""
+        length = len(word.text)
+        for i in range(length):
+            if word.direction == Direction.ACROSS:
+                key = (word.row, word.col + i, Direction.DOWN)
+            else:
+                key = (word.row + i, word.col, Direction.ACROSS)
+            for other_word in words_by_start.get(key, ()):
+                if len(other_word.text) > length and word.text in other_word.text:
+                    return True
+        return False
 
     def display(
         self,
-        available_answers: Set[str] = None,
-        clue_lookup: dict = None,
-        clue_list: List[Tuple[str, str, int]] = None,
+        available_answers: Optional[AbstractSet[str]] = None,
+        clue_lookup: Optional[dict] = None,
+        clue_list: Optional[List[Tuple[str, str, int]]] = None,
+        quality_lookup: Optional[dict] = None,
     ):
         """Display the crossword grid."""
         print("\nCrossword Grid:")
-        for row in self.grid:
-            print(" ".join(cell if cell != "." else "█" for cell in row))
+        for grid_row in self.grid:
+            print(" ".join(cell if cell != "." else "█" for cell in grid_row))
 
         # Process unintended sequences if we have the necessary data
         if available_answers is not None and clue_lookup is not None:
             final_words = self.process_unintended_sequences(
-                available_answers, clue_lookup, clue_list
+                available_answers, clue_lookup, clue_list, quality_lookup
             )
         else:
             final_words = self.words
@@ -527,7 +538,7 @@ class CrosswordGrid:
             unintended_sequences = []
 
             for sequence, row, col, direction in all_sequences:
-                if (sequence, row, col, direction) not in placed_words:
+                if self._key(sequence, row, col, direction) not in placed_words:
                     # Only show sequences of 3+ letters
                     if len(sequence) >= 3:
                         valid = sequence in available_answers
@@ -551,50 +562,95 @@ class CrosswordGenerator:
         self.width = width
         self.height = height
 
-        with open(clue_list_file, "r", encoding="utf-8") as file:
-            self.clue_list = json.load(file)
+        if orjson is not None:
+            with open(clue_list_file, "rb") as file:
+                raw_clue_list = orjson.loads(file.read())
+        else:
+            with open(clue_list_file, "r", encoding="utf-8") as file:
+                raw_clue_list = json.load(file)
 
         # Handle both 2-tuple (old format) and 3-tuple (new format with quality) clues
-        if self.clue_list and len(self.clue_list[0]) == 2:
-            # Old format: convert to new format with default quality 2
-            self.clue_list = [(clue, answer, 2) for clue, answer in self.clue_list]
+        # Old format entries get converted to the new format with default quality 2
+        old_format = bool(raw_clue_list) and len(raw_clue_list[0]) == 2
 
         # Calculate maximum word length that can fit in the grid
         max_word_length = max(self.width, self.height)
 
-        # Create set of all available answers for validation
-        # Only include words that can fit in the grid (length <= max(width, height))
-        self.available_answers = set(
-            answer
-            for clue, answer, quality in self.clue_list
-            if len(answer) <= max_word_length
-        )
+        # Build the clue list, lookups and quality counts in a single pass.
+        # Only words that can fit in the grid (length <= max(width, height)) are indexed:
+        # - available_answers: set of all answers for validation
+        # - clue_lookup: clue for each answer, used for unintended sequences
+        # - quality_lookup: quality for each answer; the first clue listed determines it
+        # - answers_by_length: answers grouped by length for efficient lookup
+        self.clue_list = []
+        available_answers = set()
+        self.clue_lookup = {}
+        self.quality_lookup: Dict[str, int] = {}
+        self.answers_by_length: Dict[int, List[Tuple[str, str, int]]] = {}
+        quality_counts: Dict[int, int] = {}
+        length_quality_counts: Dict[int, Dict[int, int]] = {}
+        for entry in raw_clue_list:
+            if old_format:
+                clue, answer = entry
+                quality = 2
+            else:
+                clue, answer, quality = entry
 
-        # Create clue lookup dictionary for unintended sequences
-        # Only include words that can fit in the grid
-        self.clue_lookup = {
-            answer: clue
-            for clue, answer, quality in self.clue_list
-            if len(answer) <= max_word_length
-        }
+            # Intern answers so every set and dict shares one string object per answer
+            answer = sys.intern(answer)
+            self.clue_list.append((clue, answer, quality))
+            quality_counts[quality] = quality_counts.get(quality, 0) + 1
 
-        # Group answers by length for efficient lookup
-        # Only include words that can fit in the grid (length <= max(width, height))
-        self.answers_by_length = {}
-        for clue, answer, quality in self.clue_list:
             length = len(answer)
-            if length <= max_word_length:  # Only include words that can fit
-                if length not in self.answers_by_length:
-                    self.answers_by_length[length] = []
-                self.answers_by_length[length].append((answer, clue, quality))
+            if length > max_word_length:
+                continue
+            available_answers.add(answer)
+            self.clue_lookup[answer] = clue
+            if answer not in self.quality_lookup:
+                self.quality_lookup[answer] = quality
+            self.answers_by_length.setdefault(length, []).append((answer, clue, quality))
+            counts = length_quality_counts.setdefault(length, {})
+            counts[quality] = counts.get(quality, 0) + 1
+
+        self.available_answers = frozenset(available_answers)
+
+        # Build posting lists for pattern lookups: posting[length][pos][letter] is a
+        # sorted array of indices into answers_by_length[length] with that letter at pos
+        self.posting = {}
+        for length, entries in self.answers_by_length.items():
+            positions: List[Dict[str, List[int]]] = [{} for _ in range(length)]
+            for index, (answer, clue, quality) in enumerate(entries):
+                for pos, char in enumerate(answer):
+                    positions[pos].setdefault(char, []).append(index)
+            self.posting[length] = [
+                {char: array("i", indices) for char, indices in letters.items()}
+                for letters in positions
+            ]
+
+        # Placements of crossing words, precomputed for this grid size: a word across
+        # row r can be crossed by the down words in _down_geometry[r], and a word down
+        # column c by the across words in _across_geometry[c]
+        self._down_geometry = [
+            self._crossing_geometry(row, self.height) for row in range(self.height)
+        ]
+        self._across_geometry = [
+            self._crossing_geometry(col, self.width) for col in range(self.width)
+        ]
+
+        # Memoized pattern matches, keyed by (length, pattern, limit), and the
+        # quality-filtered matches keyed by (length, pattern, target_quality)
+        self._match_cache: Dict[Tuple[int, Optional[str], Optional[int]], Iterable[int]] = {}
+        self._quality_match_cache: Dict[
+            Tuple[int, Optional[str], int], List[Tuple[str, str, int]]
+        ] = {}
+
+        # Running total of candidates given the full placement check by
+        # find_intersecting_words (for verbose progress output)
+        self.candidates_checked = 0
 
         print(f"Loaded {len(self.clue_list)} clue/answer pairs")
 
         # Show quality distribution
-        quality_counts = {}
-        for clue, answer, quality in self.clue_list:
-            quality_counts[quality] = quality_counts.get(quality, 0) + 1
-
         print("Quality distribution:")
         for quality in sorted(quality_counts.keys()):
             percentage = (quality_counts[quality] / len(self.clue_list)) * 100
@@ -605,18 +661,112 @@ class CrosswordGenerator:
         # Show quality distribution by word length
         print("\nQuality distribution by word length:")
         for length in sorted(self.answers_by_length.keys()):
-            stats = self.get_quality_stats(length)
-            print(f"  {length} letters: {stats['total_words']} words")
-            for quality in sorted(stats["quality_counts"].keys()):
-                count = stats["quality_counts"][quality]
-                percentage = stats["quality_percentages"][quality]
-                print(f"    Quality {quality}: {count} ({percentage:.1f}%)")
+            total_words = len(self.answers_by_length[length])
+            counts = length_quality_counts[length]
+            print(f"  {length} letters: {total_words} words")
+            for quality in sorted(counts.keys()):
+                percentage = (counts[quality] / total_words) * 100
+                print(f"    Quality {quality}: {counts[quality]} ({percentage:.1f}%)")
+
+    def _crossing_geometry(
+        self, position: int, extent: int
+    ) -> List[Tuple[int, int, int, str, str]]:
+        """Get the placements of crossing words through a row or column index.
+
+        Args:
+            position: Row (or column) index that the crossing word passes through
+            extent: Grid height (or width) along the crossing word's direction
+
+        Returns:
+            List of (start, length, intersect_pos, before, after) tuples, where
+            before/after are the wildcard runs around the intersecting letter
+        """
+        max_length = min(self.width, self.height)  # Reasonable word length for grid
+        geometry = []
+        # Limit range for performance
+        for start in range(max(0, position - 2), min(position + 1, extent - 2)):
+            end = min(start + 4, extent - 1)
+            length = end - start + 1
+            if length < 3 or length > max_length:
+                continue
+            intersect_pos = position - start
+            if 0 <= intersect_pos < length:
+                before = "." * intersect_pos
+                after = "." * (length - intersect_pos - 1)
+                geometry.append((start, length, intersect_pos, before, after))
+        return geometry
+
+    def _has_letter_at(self, length: int, pos: int, char: str) -> bool:
+        """Check whether any answer of the given length has char at pos."""
+        postings = self.posting.get(length)
+        return postings is not None and char in postings[pos]
+
+    def _match_indices(
+        self, length: int, pattern: Optional[str] = None, limit: Optional[int] = None
+    ) -> Iterable[int]:
+        """Get sorted indices into answers_by_length[length] that match pattern.
+
+        Matches do not depend on used answers, so they are memoized per generator
+        and callers filter used answers from the (small) cached result.
+
+        Args:
+            length: Word length to search for
+            pattern: Pattern to match (e.g., "A..E"), or None to match everything
+            limit: Only return indices below this value
+        """
+        key = (length, pattern, limit)
+        matched = self._match_cache.get(key)
+        if matched is None:
+            matched = self._scan_match_indices(length, pattern, limit)
+            self._match_cache[key] = matched
+        return matched
+
+    def _scan_match_indices(
+        self, length: int, pattern: Optional[str] = None, limit: Optional[int] = None
+    ) -> Iterable[int]:
+        """Compute the indices returned by `_match_indices` from the posting lists."""
+        total = len(self.answers_by_length[length])
+        if limit is None or limit > total:
+            limit = total
+        if pattern is None:
+            return range(limit)
+        if len(pattern) != length:
+            return []
+
+        postings = self.posting[length]
+        fixed = []
+        for pos, char in enumerate(pattern):
+            if char == ".":
+                continue
+            indices = postings[pos].get(char)
+            if indices is None:
+                return []
+            fixed.append((len(indices), pos, char, indices))
+
+        if not fixed:
+            return range(limit)
+
+        # Walk the rarest posting list and check the other fixed letters in place,
+        # rather than materializing sets for the longer lists
+        fixed.sort()
+        _, _, _, matched = fixed[0]
+        matched = matched[: bisect_left(matched, limit)]
+        if len(fixed) == 1:
+            return matched
+
+        entries = self.answers_by_length[length]
+        checks = [(pos, char) for _, pos, char, _ in fixed[1:]]
+        return [
+            index
+            for index in matched
+            if all(entries[index][0][pos] == char for pos, char in checks)
+        ]
 
     def get_possible_words(
         self,
         length: int,
-        pattern: str = None,
-        used_answers: Set[str] = None,
+        pattern: Optional[str] = None,
+        used_answers: Optional[AbstractSet[str]] = None,
         max_results: int = 50,
         prioritize_quality: bool = True,
     ) -> List[Tuple[str, str, int]]:
@@ -635,9 +785,9 @@ class CrosswordGenerator:
         if used_answers is None:
             used_answers = set()
 
+        entries = self.answers_by_length[length]
         possible = []
-        checked = 0
-        max_to_check = min(1000, len(self.answers_by_length[length]))
+        max_to_check = min(1000, len(entries))
 
         # If prioritizing quality, we can be more efficient since the list is sorted
         if prioritize_quality:
@@ -645,22 +795,11 @@ class CrosswordGenerator:
             quality_1_results = []
             quality_2_results = []
 
-            for answer, clue, quality in self.answers_by_length[length]:
-                checked += 1
-                if checked > max_to_check:
-                    break
-
+            for index in self._match_indices(length, pattern, max_to_check):
+                answer, clue, quality = entries[index]
                 if answer in used_answers:
                     continue
 
-                # Check pattern match - optimized with early exit
-                if pattern is not None:
-                    if len(answer) != len(pattern):
-                        continue
-                    # Use all() with generator for early exit
-                    if not all(p == "." or p == a for p, a in zip(pattern, answer)):
-                        continue
-
                 # Add to appropriate quality bucket
                 if quality == 1:
                     quality_1_results.append((answer, clue, quality))
@@ -677,20 +816,12 @@ class CrosswordGenerator:
                 possible.extend(quality_2_results[: max_results - len(possible)])
         else:
             # Original logic for non-quality-prioritized search
-            for answer, clue, quality in self.answers_by_length[length]:
-                checked += 1
-                if checked > max_to_check:
-                    break
-
+            for index in self._match_indices(length, pattern, max_to_check):
+                answer, clue, quality = entries[index]
                 if answer in used_answers:
                     continue
 
-                if pattern is None:
-                    possible.append((answer, clue, quality))
-                else:
-                    # Check if answer matches pattern (. means any character) - optimized
-                    if len(answer) == len(pattern) and all(p == "." or p == a for p, a in zip(pattern, answer)):
-                        possible.append((answer, clue, quality))
+                possible.append((answer, clue, quality))
 
                 # Limit results to prevent excessive processing
                 if len(possible) >= max_results:
@@ -701,8 +832,8 @@ class CrosswordGenerator:
     def get_best_quality_words(
         self,
         length: int,
-        pattern: str = None,
-        used_answers: Set[str] = None,
+        pattern: Optional[str] = None,
+        used_answers: Optional[AbstractSet[str]] = None,
         max_results: int = 10,
         target_quality: int = 1,
     ) -> List[Tuple[str, str, int]]:
@@ -725,30 +856,26 @@ class CrosswordGenerator:
         if used_answers is None:
             used_answers = set()
 
-        results = []
-        checked = 0
-        max_to_check = min(
-            500, len(self.answers_by_length[length])
-        )  # Reduced limit for efficiency
-
-        for answer, clue, quality in self.answers_by_length[length]:
-            checked += 1
-            if checked > max_to_check:
-                break
-
-            # Skip if quality is worse than target
-            if quality > target_quality:
-                continue
+        # Candidates at or better than the target quality don't depend on used
+        # answers, so they are cached across calls and attempts
+        key = (length, pattern, target_quality)
+        candidates = self._quality_match_cache.get(key)
+        if candidates is None:
+            entries = self.answers_by_length[length]
+            max_to_check = min(500, len(entries))  # Reduced limit for efficiency
+            candidates = [
+                entries[index]
+                for index in self._match_indices(length, pattern, max_to_check)
+                if entries[index][2] <= target_quality
+            ]
+            self._quality_match_cache[key] = candidates
 
-            if answer in used_answers:
+        results = []
+        for entry in candidates:
+            if entry[0] in used_answers:
                 continue
 
-            # Check pattern match - optimized with early exit
-            if pattern is not None:
-                if len(answer) != len(pattern) or not all(p == "." or p == a for p, a in zip(pattern, answer)):
-                    continue
-
-            results.append((answer, clue, quality))
+            results.append(entry)
 
             # Early termination: if we found enough target quality results, stop
             if len(results) >= max_results:
@@ -794,37 +921,26 @@ class CrosswordGenerator:
 
     def find_intersecting_words(
         self, grid: CrosswordGrid, word: str, row: int, col: int, direction: Direction
-    ) -> List[Tuple[str, str, int, int, int, Direction]]:
-        """Find words that could intersect with the given word placement."""
-        intersecting = []
+    ) -> Iterator[Tuple[str, str, int, int, int, Direction]]:
+        """Yield words that could intersect with the given word placement, in random order.
+
+        Candidates only get the full (expensive) placement check as they are yielded,
+        so a caller that stops at the first usable word skips checking the rest. Each
+        check is counted in self.candidates_checked.
+        """
+        candidates = []
         used_answers = grid.get_used_answers()
-        max_intersections = 20  # Limit total intersections to prevent slowdown
 
         if direction == Direction.ACROSS:
             # Look for vertical words that could intersect
             for i, char in enumerate(word):
-                if len(intersecting) >= max_intersections:
-                    break
-
                 word_col = col + i
-                # Check above and below - limit range for performance
-                for start_row in range(max(0, row - 2), min(row + 1, grid.height - 2)):
-                    if len(intersecting) >= max_intersections:
-                        break
-
-                    end_row = min(start_row + 4, grid.height - 1)
-                    length = end_row - start_row + 1
-                    if length < 3 or length > min(
-                        grid.width, grid.height
-                    ):  # Reasonable word length for grid
-                        continue
-
-                    # Create pattern with the intersecting character
-                    pattern = ["."] * length
-                    intersect_pos = row - start_row
-                    if 0 <= intersect_pos < length:
-                        pattern[intersect_pos] = char
-                        pattern_str = "".join(pattern)
+                # Check above and below using the precomputed placements
+                for start_row, length, intersect_pos, before, after in self._down_geometry[row]:
+                    # Skip the lookup when no answer of this length has the letter there
+                    if self._has_letter_at(length, intersect_pos, char):
+                        # Create pattern with the intersecting character
+                        pattern_str = before + char + after
 
                         possible_words = self.get_best_quality_words(
                             length,
@@ -834,55 +950,31 @@ class CrosswordGenerator:
                             target_quality=1,
                         )
                         for answer, clue, quality in possible_words:
-                            if len(intersecting) >= max_intersections:
-                                break
                             # OPTIMIZATION: Do basic validation first before expensive validation
                             if (start_row + len(answer) <= grid.height and
                                 (start_row == 0 or grid.grid[start_row - 1][word_col] == ".") and
                                 (start_row + len(answer) >= grid.height or grid.grid[start_row + len(answer)][word_col] == ".")):
-                                if grid.is_valid_placement(
-                                    answer,
-                                    start_row,
-                                    word_col,
-                                    Direction.DOWN,
-                                    self.available_answers,
-                                ):
-                                    intersecting.append(
-                                        (
-                                            answer,
-                                            clue,
-                                            quality,
-                                            start_row,
-                                            word_col,
-                                            Direction.DOWN,
-                                        )
+                                candidates.append(
+                                    (
+                                        answer,
+                                        clue,
+                                        quality,
+                                        start_row,
+                                        word_col,
+                                        Direction.DOWN,
                                     )
+                                )
 
         else:  # DOWN
             # Look for horizontal words that could intersect
             for i, char in enumerate(word):
-                if len(intersecting) >= max_intersections:
-                    break
-
                 word_row = row + i
-                # Check left and right - limit range for performance
-                for start_col in range(max(0, col - 2), min(col + 1, grid.width - 2)):
-                    if len(intersecting) >= max_intersections:
-                        break
-
-                    end_col = min(start_col + 4, grid.width - 1)
-                    length = end_col - start_col + 1
-                    if length < 3 or length > min(
-                        grid.width, grid.height
-                    ):  # Reasonable word length for grid
-                        continue
-
-                    # Create pattern with the intersecting character
-                    pattern = ["."] * length
-                    intersect_pos = col - start_col
-                    if 0 <= intersect_pos < length:
-                        pattern[intersect_pos] = char
-                        pattern_str = "".join(pattern)
+                # Check left and right using the precomputed placements
+                for start_col, length, intersect_pos, before, after in self._across_geometry[col]:
+                    # Skip the lookup when no answer of this length has the letter there
+                    if self._has_letter_at(length, intersect_pos, char):
+                        # Create pattern with the intersecting character
+                        pattern_str = before + char + after
 
                         possible_words = self.get_best_quality_words(
                             length,
@@ -892,31 +984,35 @@ class CrosswordGenerator:
                             target_quality=1,
                         )
                         for answer, clue, quality in possible_words:
-                            if len(intersecting) >= max_intersections:
-                                break
                             # OPTIMIZATION: Do basic validation first before expensive validation
                             if (start_col + len(answer) <= grid.width and
                                 (start_col == 0 or grid.grid[word_row][start_col - 1] == ".") and
                                 (start_col + len(answer) >= grid.width or grid.grid[word_row][start_col + len(answer)] == ".")):
-                                if grid.is_valid_placement(
-                                    answer,
-                                    word_row,
-                                    start_col,
-                                    Direction.ACROSS,
-                                    self.available_answers,
-                                ):
-                                    intersecting.append(
-                                        (
-                                            answer,
-                                            clue,
-                                            quality,
-                                            word_row,
-                                            start_col,
-                                            Direction.ACROSS,
-                                        )
+                                candidates.append(
+                                    (
+                                        answer,
+                                        clue,
+                                        quality,
+                                        word_row,
+                                        start_col,
+                                        Direction.ACROSS,
                                     )
+                                )
 
-        return intersecting
+        # Draw candidates in random order one at a time (an incremental Fisher-Yates
+        # shuffle), so a caller that stops early never pays to shuffle the rest
+        remaining = len(candidates)
+        while remaining:
+            index = int(random.random() * remaining)
+            remaining -= 1
+            candidate = candidates[index]
+            candidates[index] = candidates[remaining]
+            answer, clue, quality, cand_row, cand_col, cand_direction = candidate
+            self.candidates_checked += 1
+            if grid.is_valid_placement(
+                answer, cand_row, cand_col, cand_direction, self.available_answers
+            ):
+                yield candidate
 
     def _score_puzzle_quality(self, grid: CrosswordGrid) -> int:
         """Score puzzle quality - lower is better. Returns empty squares + invalid sequences."""
@@ -939,7 +1035,7 @@ class CrosswordGenerator:
         """
         # Get final word count including unintended sequences
         final_word_count = grid.get_final_word_count(
-            self.available_answers, self.clue_lookup, self.clue_list
+            self.available_answers, self.clue_lookup, self.clue_list, self.quality_lookup
         )
 
         # Calculate average quality
@@ -988,8 +1084,8 @@ class CrosswordGenerator:
     def calculate_average_quality(
         self,
         grid: CrosswordGrid,
-        available_answers: Set[str] = None,
-        clue_lookup: dict = None,
+        available_answers: Optional[AbstractSet[str]] = None,
+        clue_lookup: Optional[dict] = None,
     ) -> float:
         """Calculate the average quality score for all clues in the crossword.
 
@@ -1001,7 +1097,7 @@ class CrosswordGenerator:
         # Use final words if available_answers and clue_lookup are provided
         if available_answers is not None and clue_lookup is not None:
             final_words = grid.get_final_words(
-                available_answers, clue_lookup, self.clue_list
+                available_answers, clue_lookup, self.clue_list, self.quality_lookup
             )
         else:
             final_words = grid.words
@@ -1056,7 +1152,7 @@ class CrosswordGenerator:
         ):
             if verbose_iteration_1:
                 tqdm.write(
-                    f"  ✗ Cannot place start word '{start_word}' at ({start_row},{start_col}) {start_direction.value}"
+                    f"  ✗ Cannot place start word '{start_word}' at ({start_row},{start_col}) {start_direction.name.lower()}"
                 )
             return None, False, 0.0
 
@@ -1065,7 +1161,7 @@ class CrosswordGenerator:
         )
         if verbose_iteration_2:
             tqdm.write(
-                f"  ✓ Placed start word '{start_word}' at ({start_row},{start_col}) {start_direction.value}"
+                f"  ✓ Placed start word '{start_word}' at ({start_row},{start_col}) {start_direction.name.lower()}"
             )
 
         # Try to add more words
@@ -1074,44 +1170,36 @@ class CrosswordGenerator:
         for iteration in range(50):  # Reduced max iterations for better performance
             # Find intersecting words for existing words
             found_word = False
-            total_candidates = 0
+            checked_before = self.candidates_checked
 
             for existing_word in grid.words[
                 :
             ]:  # Use slice to avoid modification during iteration
-                intersecting_words = self.find_intersecting_words(
+                # Candidates come in random order and already fit the grid, so
+                # place the first one
+                for word, clue, quality, row, col, direction in self.find_intersecting_words(
                     grid,
                     existing_word.text,
                     existing_word.row,
                     existing_word.col,
                     existing_word.direction,
-                )
-                total_candidates += len(intersecting_words)
-
-                if intersecting_words:
-                    # Shuffle and try a few
-                    random.shuffle(intersecting_words)
-                    for word, clue, quality, row, col, direction in intersecting_words[
-                        :5
-                    ]:  # Try up to 5
-                        if grid.is_valid_placement(
-                            word, row, col, direction, self.available_answers
-                        ):
-                            grid.place_word(word, row, col, direction, clue, quality)
-                            words_added += 1
-                            if verbose_iteration_2:
-                                tqdm.write(
-                                    f"  ✓ Added word #{words_added}: '{word}' at ({row},{col}) {direction.value}"
-                                )
-                            found_word = True
-                            break
-                    if found_word:
-                        break
+                ):
+                    grid.place_word(word, row, col, direction, clue, quality)
+                    words_added += 1
+                    if verbose_iteration_2:
+                        tqdm.write(
+                            f"  ✓ Added word #{words_added}: '{word}' at ({row},{col}) {direction.name.lower()}"
+                        )
+                    found_word = True
+                    break
+                if found_word:
+                    break
 
             if not found_word:
                 if verbose_iteration_2:
                     tqdm.write(
-                        f"  → Stopped after {iteration + 1} iterations, {total_candidates} candidates tried"
+                        f"  → Stopped after {iteration + 1} iterations, "
+                        f"{self.candidates_checked - checked_before} candidates tried"
                     )
                 break
 
@@ -1123,7 +1211,7 @@ class CrosswordGenerator:
         if verbose_iteration_1:
             # Calculate final word count including unintended sequences
             final_word_count = grid.get_final_word_count(
-                self.available_answers, self.clue_lookup, self.clue_list
+                self.available_answers, self.clue_lookup, self.clue_list, self.quality_lookup
             )
             tqdm.write(
                 f"  → Final stats: {len(grid.words)} placed words, {final_word_count} total words (including unintended sequences), {empty_squares} empty squares"
@@ -1174,8 +1262,38 @@ class CrosswordGenerator:
                 tqdm.write(f"  ✗ Failed: {', '.join(reasons)}")
             return grid, False, 0.0
 
+    def _iter_parallel_attempts(
+        self, max_iterations: int, workers: int, chunk_size: int = 25
+    ) -> Iterator[List[tuple]]:
+        """Run attempts in worker processes and yield each chunk's results in order.
+
+        Each chunk gets its own seed drawn from `random`, so a seeded run is
+        reproducible for a given worker count. Only a few chunks per worker are
+        queued at a time, so stopping early leaves little work to cancel.
+        """
+        chunks = [
+            min(chunk_size, max_iterations - start) for start in range(0, max_iterations, chunk_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_attempt_worker, initargs=(self,)
+        ) as executor:
+            pending: Deque[Future] = deque()
+            next_chunk = 0
+            try:
+                while pending or next_chunk < len(chunks):
+                    while next_chunk < len(chunks) and len(pending) < workers * 2:
+                        seed = random.getrandbits(32)
+                        pending.append(
+                            executor.submit(_run_attempt_chunk, seed, chunks[next_chunk])
+                        )
+                        next_chunk += 1
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def generate_crosswords_batch(
-        self, count: int, max_iterations: int, verbose_level: int = 1
+        self, count: int, max_iterations: int, verbose_level: int = 1, workers: int = 1
     ) -> List[CrosswordGrid]:
         """Generate multiple crosswords with a total iteration limit.
 
@@ -1183,6 +1301,7 @@ class CrosswordGenerator:
             count: Number of crosswords to return
             max_iterations: Maximum total iterations to run
             verbose_level: Verbosity level for output
+            workers: Number of worker processes to run attempts in (1 runs them in-process)
 
         Returns:
             List of crosswords, with perfect puzzles first, then imperfect puzzles,
@@ -1200,45 +1319,30 @@ class CrosswordGenerator:
         last_perfect_attempts = 0
 
         # Create progress bar with dynamic description
-        progress_bar = tqdm(range(max_iterations), desc="Generating crosswords...")
+        progress_bar = tqdm(total=max_iterations, desc="Generating crosswords...")
 
         def update_progress_description():
             """Update the progress bar description with current counts."""
             desc = f"🟢: {len(perfect_crosswords)}, 🟡: {len(imperfect_crosswords)}, 🔴: {len(constraint_violating_crosswords)}"
             progress_bar.set_description(desc)
 
-        for attempt in progress_bar:
-            verbose_iteration_1 = verbose_level >= 1 and attempt < 1000
-            verbose_iteration_2 = verbose_level >= 2 and attempt < 1000
-
-            if verbose_iteration_1 and (attempt % 100 == 0 or attempt < 1000):
-                tqdm.write(f"\nAttempt {attempt + 1}:")
-                tqdm.write(f"  Perfect puzzles found: {len(perfect_crosswords)}")
-                tqdm.write(f"  Imperfect puzzles found: {len(imperfect_crosswords)}")
-                tqdm.write(
-                    f"  Constraint-violating puzzles found: {len(constraint_violating_crosswords)}"
-                )
-
-            # Generate a single crossword attempt
-            grid, is_valid, quality_score = self.generate_single_crossword_attempt(
-                verbose_iteration_1, verbose_iteration_2
-            )
-
-            if grid is None:  # No center words available
-                continue
-
+        def record_attempt(
+            attempt: int,
+            grid: CrosswordGrid,
+            is_valid: bool,
+            quality_score: float,
+            constraint_score: Optional[float],
+            verbose: bool,
+        ) -> bool:
+            """Sort an attempt's grid into the result lists. Returns True once enough perfect puzzles exist."""
+            nonlocal last_perfect_attempts
+
+            # Each attempt builds a fresh grid that is never modified afterwards,
+            # so it is kept as-is rather than copied
             if is_valid:
-                # Create a copy of the grid - optimized shallow copy for immutable data
-                grid_copy = CrosswordGrid(
-                    grid.width,
-                    grid.height,
-                    [row[:] for row in grid.grid],  # Shallow copy is sufficient for strings
-                    grid.words[:],  # Shallow copy is sufficient for Word objects
-                )
-
                 if quality_score == 1.0:
                     # Perfect puzzle
-                    perfect_crosswords.append(grid_copy)
+                    perfect_crosswords.append(grid)
                     update_progress_description()
                     tqdm.write(
                         f"🎯 Found perfect crossword #{len(perfect_crosswords)} in {attempt + 1 - last_perfect_attempts} attempts! (Quality: {quality_score:.2f})"
@@ -1246,16 +1350,14 @@ class CrosswordGenerator:
                     last_perfect_attempts = attempt + 1
                 else:
                     # Imperfect but valid puzzle
-                    imperfect_crosswords.append(grid_copy)
+                    imperfect_crosswords.append(grid)
 
                     # Only keep (count - perfect) imperfect puzzles since perfect are prioritized first
                     if len(imperfect_crosswords) > count - len(perfect_crosswords):
-                        imperfect_crosswords = imperfect_crosswords[
-                            : count - len(perfect_crosswords)
-                        ]
+                        del imperfect_crosswords[count - len(perfect_crosswords) :]
 
                     update_progress_description()
-                    if verbose_iteration_1:
+                    if verbose:
                         tqdm.write(
                             f"✓ Found imperfect crossword #{len(imperfect_crosswords)} in {attempt + 1} attempts! (Quality: {quality_score:.2f})"
                         )
@@ -1265,21 +1367,14 @@ class CrosswordGenerator:
                     tqdm.write(
                         f"🎯 Found {len(perfect_crosswords)} perfect puzzles! Stopping early."
                     )
-                    break
+                    return True
             else:
-                # Constraint-violating puzzle - calculate score and track it
-                constraint_score = self._score_constraint_violating_puzzle(grid)
-
-                # Create a copy of the grid - optimized shallow copy for immutable data
-                grid_copy = CrosswordGrid(
-                    grid.width,
-                    grid.height,
-                    [row[:] for row in grid.grid],  # Shallow copy is sufficient for strings
-                    grid.words[:],  # Shallow copy is sufficient for Word objects
-                )
+                # Constraint-violating puzzle - calculate score (unless a worker already did)
+                if constraint_score is None:
+                    constraint_score = self._score_constraint_violating_puzzle(grid)
 
                 # Add to constraint-violating list
-                constraint_violating_crosswords.append((grid_copy, constraint_score))
+                constraint_violating_crosswords.append((grid, constraint_score))
 
                 # Keep only the best constraint-violating puzzles to avoid memory issues
                 # Sort by score (ascending) and keep only (count - perfect - imperfect) since perfect and imperfect are prioritized first
@@ -1288,15 +1383,57 @@ class CrosswordGenerator:
                     count - len(perfect_crosswords) - len(imperfect_crosswords)
                 )
                 if len(constraint_violating_crosswords) > max_invalid_needed:
-                    constraint_violating_crosswords = constraint_violating_crosswords[
-                        :max_invalid_needed
-                    ]
+                    del constraint_violating_crosswords[max_invalid_needed:]
 
                 update_progress_description()
-                if verbose_iteration_1:
+                if verbose:
                     tqdm.write(
                         f"⚠ Found constraint-violating crossword #{len(constraint_violating_crosswords)} in {attempt + 1} attempts! (Penalty: {constraint_score:.1f})"
                     )
+            return False
+
+        if workers > 1:
+            # Attempts are independent, so run them in chunks across processes and
+            # record the results in attempt order
+            attempt = 0
+            for results in self._iter_parallel_attempts(max_iterations, workers):
+                done = False
+                for grid, is_valid, quality_score, constraint_score in results:
+                    progress_bar.update(1)
+                    if grid is not None and record_attempt(
+                        attempt, grid, is_valid, quality_score, constraint_score, False
+                    ):
+                        done = True
+                        break
+                    attempt += 1
+                if done:
+                    break
+        else:
+            for attempt in range(max_iterations):
+                progress_bar.update(1)
+                verbose_iteration_1 = verbose_level >= 1 and attempt < 1000
+                verbose_iteration_2 = verbose_level >= 2 and attempt < 1000
+
+                if verbose_iteration_1 and (attempt % 100 == 0 or attempt < 1000):
+                    tqdm.write(f"\nAttempt {attempt + 1}:")
+                    tqdm.write(f"  Perfect puzzles found: {len(perfect_crosswords)}")
+                    tqdm.write(f"  Imperfect puzzles found: {len(imperfect_crosswords)}")
+                    tqdm.write(
+                        f"  Constraint-violating puzzles found: {len(constraint_violating_crosswords)}"
+                    )
+
+                # Generate a single crossword attempt
+                grid, is_valid, quality_score = self.generate_single_crossword_attempt(
+                    verbose_iteration_1, verbose_iteration_2
+                )
+
+                if grid is None:  # No center words available
+                    continue
+
+                if record_attempt(
+                    attempt, grid, is_valid, quality_score, None, verbose_iteration_1
+                ):
+                    break
 
         # Close the progress bar
         progress_bar.close()
@@ -1349,6 +1486,38 @@ class CrosswordGenerator:
         return result
 
 
+# Generator shared by the attempts run in a worker process, set by _init_attempt_worker
+_worker_generator: Optional[CrosswordGenerator] = None
+
+
+def _init_attempt_worker(generator: CrosswordGenerator) -> None:
+    """Store the generator for attempts run in this worker process."""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _run_attempt_chunk(seed: int, attempts: int) -> List[tuple]:
+    """Run a chunk of attempts in a worker process.
+
+    Returns:
+        List of (grid, is_valid, quality_score, constraint_score) tuples, where
+        constraint_score is only set for constraint-violating grids
+    """
+    generator = _worker_generator
+    assert generator is not None, "worker process was not initialized"
+    random.seed(seed)
+    results = []
+    for _ in range(attempts):
+        grid, is_valid, quality_score = generator.generate_single_crossword_attempt(
+            False, False
+        )
+        constraint_score = None
+        if grid is not None and not is_valid:
+            constraint_score = generator._score_constraint_violating_puzzle(grid)
+        results.append((grid, is_valid, quality_score, constraint_score))
+    return results
+
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -1368,6 +1537,7 @@ Examples:
   python crossword_generator.py --extract --count 3
   python crossword_generator.py --width 7 --height 7
   python crossword_generator.py --width 10  # height will be set to 10 as well
+  python crossword_generator.py --count 5 --workers 4
         """,
     )
 
@@ -1398,6 +1568,13 @@ Examples:
         help="Height of the crossword grid (default: same as width)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to parse crossword files and run generation attempts in (default: 1)",
+    )
+
     return parser.parse_args()
 
 
@@ -1428,7 +1605,7 @@ def main():
         try:
             collins_dictionary = "Collins-Scrabble-Words-2019.tsv"
             master_clues = build_master_clue_list(
-                crosswords_dir, collins_dictionary, master_clues_file
+                crosswords_dir, collins_dictionary, master_clues_file, workers=args.workers
             )
             if not master_clues:
                 print(
@@ -1461,7 +1638,7 @@ def main():
             f"Using batch generation: {num_crosswords} crosswords, max {max_iterations} iterations"
         )
         crosswords = generator.generate_crosswords_batch(
-            num_crosswords, max_iterations, verbose_level=0
+            num_crosswords, max_iterations, verbose_level=0, workers=args.workers
         )
 
         success_count = 0
@@ -1471,12 +1648,18 @@ def main():
             print("=" * 60)
 
             crossword.display(
-                generator.available_answers, generator.clue_lookup, generator.clue_list
+                generator.available_answers,
+                generator.clue_lookup,
+                generator.clue_list,
+                generator.quality_lookup,
             )
 
             # Get final words including unintended sequences
             final_words = crossword.get_final_words(
-                generator.available_answers, generator.clue_lookup, generator.clue_list
+                generator.available_answers,
+                generator.clue_lookup,
+                generator.clue_list,
+                generator.quality_lookup,
             )
             final_word_count = len(final_words)
             final_used_answers = {word.text for word in final_words}
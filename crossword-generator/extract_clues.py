@@ -5,10 +5,17 @@ Now includes Collins Scrabble Words dictionary with quality ratings.
 """
 
 import argparse
-import csv
 import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import orjson  # Optional: much faster JSON parsing and serialization
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 
 def extract_clue_answer_pairs(json_file_path: str) -> Dict[str, str]:
@@ -16,8 +23,12 @@ def extract_clue_answer_pairs(json_file_path: str) -> Dict[str, str]:
     clue_answer_pairs = {}
 
     try:
-        with open(json_file_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
+        if orjson is not None:
+            with open(json_file_path, "rb") as file:
+                data = orjson.loads(file.read())
+        else:
+            with open(json_file_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
 
         # Navigate to the crossword data
         body = data.get("body", [])
@@ -28,6 +39,10 @@ def extract_clue_answer_pairs(json_file_path: str) -> Dict[str, str]:
         cells = crossword_data.get("cells", [])
         clues = crossword_data.get("clues", [])
 
+        # Each cell's answer letter ("" for blocks), looked up once rather than per clue
+        cell_answers = [cell.get("answer", "") for cell in cells]
+        cell_count = len(cell_answers)
+
         # For each clue, construct the answer from the cells
         for clue in clues:
             clue_text_list = clue.get("text", [])
@@ -44,17 +59,13 @@ def extract_clue_answer_pairs(json_file_path: str) -> Dict[str, str]:
                 continue
 
             # Build the answer from the cells
-            answer_chars = []
-            for cell_index in cell_indices:
-                if cell_index < len(cells) and "answer" in cells[cell_index]:
-                    answer_chars.append(cells[cell_index]["answer"])
-
-            if answer_chars:
-                answer = "".join(answer_chars)
-                if (
-                    answer and clue_text and not clue_text.startswith("See ")
-                ):  # Filter out relational clues
-                    clue_answer_pairs[clue_text] = answer
+            answer = "".join(
+                cell_answers[cell_index] for cell_index in cell_indices if cell_index < cell_count
+            )
+            if (
+                answer and clue_text and not clue_text.startswith("See ")
+            ):  # Filter out relational clues
+                clue_answer_pairs[clue_text] = answer
 
     except Exception as e:
         print(f"Error processing {json_file_path}: {e}")
@@ -62,22 +73,37 @@ def extract_clue_answer_pairs(json_file_path: str) -> Dict[str, str]:
     return clue_answer_pairs
 
 
+def iter_clue_answer_pairs(json_files: List[str], workers: int = 1) -> Iterator[Dict[str, str]]:
+    """Yield each file's clue-answer pairs in order, parsed in worker processes if workers > 1."""
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(extract_clue_answer_pairs, json_files, chunksize=32)
+    else:
+        for json_file in json_files:
+            yield extract_clue_answer_pairs(json_file)
+
+
 def extract_collins_words(collins_file: str) -> List[Tuple[str, str]]:
     """Extract words and definitions from Collins Scrabble Words TSV file."""
     collins_words = []
 
     try:
         with open(collins_file, "r", encoding="utf-8") as file:
-            reader = csv.reader(file, delimiter="\t")
-            for row in reader:
+            # Each line is "WORD<tab>definition" with no quoting, so a plain split is
+            # enough and faster than csv.reader
+            for line in file:
+                row = line.split("\t")
                 if len(row) >= 2:
-                    word = row[0].strip().upper()
-                    definition = row[1].strip()
+                    word = row[0].strip()
 
-                    # Filter by word length (2-5 letters only)
+                    # Filter by word length (2-5 letters only) before doing any other
+                    # work, since most rows are longer words that get skipped
                     if len(word) < 2 or len(word) > 6:
                         continue
 
+                    word = word.upper()
+                    definition = row[1].strip()
+
                     # Clean up the definition to create a clue
                     clue = definition
 
@@ -137,42 +163,54 @@ def build_master_clue_list(
     crosswords_dir: str,
     collins_file: str = None,
     output_file: str = "master_clues.json",
+    workers: int = 1,
 ):
-    """Build master list of all clue/answer pairs from crossword files and Collins dictionary."""
+    """Build master list of all clue/answer pairs from crossword files and Collins dictionary.
+
+    Files are parsed in `workers` processes when workers > 1; deduplication always
+    runs here in file order, so the result doesn't depend on the worker count.
+    """
     crosswords_path = Path(crosswords_dir)
     master_clues = []  # List of tuples: (clue, answer, quality)
     duplicate_count = 0
     file_count = 0
-    seen_pairs = set()  # Track exact clue/answer pairs to avoid duplicates
+    # Track hashes of exact clue/answer pairs to avoid duplicates; storing the 64-bit
+    # hash rather than the pair keeps the set small, and collisions are negligible
+    seen_pairs = set()
     answer_quality = {}  # Track the best quality for each answer
     max_clue_length = 0  # Track maximum clue length from crossword files
 
     print(f"Scanning crossword files in {crosswords_path}...")
 
     # Process all JSON files in the crosswords directory (quality = 1)
-    for json_file in crosswords_path.glob("*.json"):
+    # os.scandir lists the directory without building a Path per file
+    json_files = [
+        entry.path for entry in os.scandir(crosswords_path) if entry.name.endswith(".json")
+    ]
+    for clue_pairs in iter_clue_answer_pairs(json_files, workers):
         file_count += 1
         if file_count % 100 == 0:
             print(f"Processed {file_count} files...")
 
-        clue_pairs = extract_clue_answer_pairs(str(json_file))
-
         for clue, answer in clue_pairs.items():
+            # Intern answers so repeats across files share one string object
+            answer = sys.intern(answer)
+
             # Track maximum clue length
             max_clue_length = max(max_clue_length, len(clue))
 
-            clue_answer_pair = (clue, answer)
-            if clue_answer_pair in seen_pairs:
+            pair_hash = hash((clue, answer))
+            if pair_hash in seen_pairs:
                 # Exact same clue/answer pair already exists
                 duplicate_count += 1
                 continue
             else:
                 # Add new clue/answer pair with quality 1 (from existing crosswords)
-                seen_pairs.add(clue_answer_pair)
+                seen_pairs.add(pair_hash)
                 master_clues.append((clue, answer, 1))
-                # Track the best quality for this answer (lower number = higher quality)
-                if answer not in answer_quality or 1 < answer_quality[answer]:
-                    answer_quality[answer] = 1
+                # Track the best quality for this answer (lower number = higher quality);
+                # 1 is the best possible, so it always wins
+                answer_quality[answer] = 1
 
     print(f"\nProcessed {file_count} crossword files")
     print(f"Found {len(master_clues)} unique clue/answer pairs from crosswords")
@@ -194,22 +232,24 @@ def build_master_clue_list(
                 collins_length_skipped += 1
                 continue
 
-            clue_answer_pair = (clue, answer)
-            if clue_answer_pair in seen_pairs:
+            answer = sys.intern(answer)
+            pair_hash = hash((clue, answer))
+            if pair_hash in seen_pairs:
                 collins_duplicates += 1
                 continue
 
             # Check if we already have a higher quality clue for this answer
-            if answer in answer_quality and answer_quality[answer] < 2:
+            best_quality = answer_quality.get(answer)
+            if best_quality is not None and best_quality < 2:
                 collins_quality_skipped += 1
                 continue
 
             # Add Collins clue/answer pair with quality 2
-            seen_pairs.add(clue_answer_pair)
+            seen_pairs.add(pair_hash)
             master_clues.append((clue, answer, 2))
             collins_added += 1
-            # Update quality tracking
-            if answer not in answer_quality or 2 < answer_quality[answer]:
+            # Update quality tracking (anything already tracked is quality 2 here)
+            if best_quality is None:
                 answer_quality[answer] = 2
 
         print(f"Added {collins_added} unique clue/answer pairs from Collins dictionary")
@@ -227,8 +267,13 @@ def build_master_clue_list(
 
     # Save to JSON file
     output_path = Path(output_file)
-    with open(output_path, "w", encoding="utf-8") as file:
-        json.dump(master_clues, file, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # Same output as json.dump(..., indent=2, ensure_ascii=False)
+        with open(output_path, "wb") as file:
+            file.write(orjson.dumps(master_clues, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as file:
+            json.dump(master_clues, file, indent=2, ensure_ascii=False)
 
     print(f"Master clue list saved to {output_path}")
     return master_clues
@@ -254,6 +299,7 @@ Examples:
   python extract_clues.py
   python extract_clues.py --crosswords-dir ./my-crosswords --output my_clues.json
   python extract_clues.py --no-collins --output crossword_only.json
+  python extract_clues.py --workers 4
         """,
     )
 
@@ -288,6 +334,13 @@ Examples:
         "--stats", action="store_true", help="Show detailed statistics after processing"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to parse crossword files in (default: 1)",
+    )
+
     return parser.parse_args()
 
 
@@ -329,7 +382,7 @@ def main():
 
     # Extract clues
     master_clues = build_master_clue_list(
-        args.crosswords_dir, collins_file, args.output
+        args.crosswords_dir, collins_file, args.output, workers=args.workers
     )
 
     # Print statistics if requested
@@ -6,14 +6,30 @@ Stores results in SQLite database (statistics.db) with format {username: time}
 Each date contains entries for all users who completed puzzles on that date.
 """
 
+import atexit
+import gzip
+import hashlib
 import json
+import os
+import queue
+import re
 import sqlite3
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import pytz
 from flask import Flask, jsonify, request, send_from_directory
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to Flask's stdlib-json jsonify
+    orjson = None
+
 app = Flask(__name__)
 
 # Directory to store JSON files (for migration and backward compatibility)
@@ -33,20 +49,254 @@ DB_PATH = DATA_DIR / "statistics.db"
 # Edit scoretracker/non_credit_dates.json — use display dates (YYYY-MM-DD).
 NON_CREDIT_DATES_PATH = Path(__file__).parent / "non_credit_dates.json"
 
+# Puzzle dates and streaks follow Pacific time; no streaks are counted before 2026
+PACIFIC = pytz.timezone('America/Los_Angeles')
+MIN_STREAK_DATE = date(2026, 1, 1)
+
+# Username IN lists are padded with NULLs up to one of these sizes, so requests for any
+# number of users (max 100) reuse a handful of prepared statements
+IN_LIST_SIZES = (1, 4, 16, 64, 100)
+
+# Insert or update one result. UPSERT (SQLite 3.24+) updates an existing row in place,
+# where INSERT OR REPLACE deletes it and inserts a new one.
+if sqlite3.sqlite_version_info >= (3, 24, 0):
+    UPSERT_RESULT_SQL = (
+        "INSERT INTO results (date, username, time, completion_timestamp) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(date, username) DO UPDATE SET "
+        "time = excluded.time, completion_timestamp = excluded.completion_timestamp"
+    )
+else:
+    UPSERT_RESULT_SQL = (
+        "INSERT OR REPLACE INTO results (date, username, time, completion_timestamp) VALUES (?, ?, ?, ?)"
+    )
+
+# Connections are kept open and reused across requests rather than reopening the
+# database file each time. Writes share one connection behind a lock; reads check
+# a connection out of a small pool (WAL lets them run while a write is in progress).
+READER_POOL_SIZE = os.cpu_count() or 1
+_reader_pool = queue.Queue(maxsize=READER_POOL_SIZE)
+_writer_conn = None
+_writer_lock = threading.Lock()
+
+# Response bodies of read-mostly endpoints as {request path: (version, body, etag)}.
+# The version is the database's data_version, read on a dedicated connection where it
+# changes whenever any other connection (this process's writer, another worker,
+# edit_time.py) commits; for the crossword listing it is the directory's mtime, which
+# changes when a file is added, removed or renamed.
+RESPONSE_CACHE_SIZE = 512
+_response_cache = {}
+
+# JSON responses at least this large are gzipped for clients that accept it.
+# Compressed bodies of cached responses are kept by ETag so each is compressed once.
+GZIP_MIN_SIZE = 1024
+_gzip_cache = {}
+_version_conn = None
+_version_lock = threading.Lock()
+
+# How often (seconds) the writer refreshes the query planner's statistics
+OPTIMIZE_INTERVAL = 900
+_last_optimize = time.monotonic()
+
 
 def get_db_connection():
     """Get a connection to the SQLite database."""
     # Ensure data directory exists
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
+    # timeout is SQLite's busy timeout: wait up to 30s for another worker's lock
+    # instead of failing with "database is locked"
+    # Pooled connections may be used from any request thread, one at a time
+    conn = sqlite3.connect(str(DB_PATH), timeout=30, check_same_thread=False)
+    # WAL mode (set in init_database) stays durable with NORMAL sync and fsyncs far less;
+    # synchronous is a per-connection setting
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # Allow up to 64MB of page cache (allocated only as pages are read) and keep
+    # ORDER BY sorts in memory
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
+@contextmanager
+def get_reader():
+    """Check a read connection out of the pool for the duration of the block."""
+    try:
+        conn = _reader_pool.get_nowait()
+    except queue.Empty:
+        conn = get_db_connection()
+    try:
+        yield conn
+    finally:
+        try:
+            _reader_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+@contextmanager
+def get_writer():
+    """Hold the shared write connection for the duration of the block."""
+    global _writer_conn, _last_optimize
+    with _writer_lock:
+        if _writer_conn is None:
+            _writer_conn = get_db_connection()
+            # Open write transactions with BEGIN IMMEDIATE so the write lock is taken
+            # (or waited for) up front instead of being upgraded mid-transaction
+            _writer_conn.isolation_level = "IMMEDIATE"
+        try:
+            yield _writer_conn
+        finally:
+            # Never hand the next request a transaction left open by this one
+            if _writer_conn.in_transaction:
+                _writer_conn.rollback()
+            # Only tables that changed enough since the last run are re-analyzed
+            now = time.monotonic()
+            if now - _last_optimize >= OPTIMIZE_INTERVAL:
+                _last_optimize = now
+                try:
+                    _writer_conn.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    app.logger.warning(f"PRAGMA optimize failed: {e}")
+
+
+def get_data_version():
+    """Return a value that changes whenever the database has been written to."""
+    global _version_conn
+    with _version_lock:
+        if _version_conn is None:
+            _version_conn = get_db_connection()
+        return _version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+
+def close_connections():
+    """
+    Close this process's pooled connections. The last connection to the database
+    to close checkpoints the WAL and removes the -wal/-shm files.
+    """
+    global _writer_conn, _version_conn
+    while True:
+        try:
+            _reader_pool.get_nowait().close()
+        except queue.Empty:
+            break
+    with _writer_lock:
+        if _writer_conn is not None:
+            _writer_conn.close()
+            _writer_conn = None
+    with _version_lock:
+        if _version_conn is not None:
+            _version_conn.close()
+            _version_conn = None
+
+
+atexit.register(close_connections)
+
+
+def get_cached_response(key, version):
+    """Return the cached (body, etag) for key if it was built at this version."""
+    cached = _response_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1], cached[2]
+    return None
+
+
+def cache_response(key, version, body):
+    """Remember a response body built at the given version; returns (body, etag)."""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    if len(_response_cache) >= RESPONSE_CACHE_SIZE:
+        _response_cache.clear()
+    _response_cache[key] = (version, body, etag)
+    return body, etag
+
+
+def accepts_gzip():
+    """Whether the client accepts gzip (a listed encoding with q=0 means it refuses it)."""
+    return request.accept_encodings['gzip'] > 0
+
+
+def cached_json_response(body, etag):
+    """
+    Respond with a cached JSON body, or 304 Not Modified if the client's copy matches.
+    no-cache lets browsers keep the body but makes them revalidate on every use.
+    """
+    response = app.response_class(body, mimetype='application/json')
+    if len(body) >= GZIP_MIN_SIZE:
+        # Decide here rather than in gzip_json_response so a 304 carries the same
+        # validator (weak when the 200 is gzipped) and Vary as the full response
+        response.set_etag(etag, weak=accepts_gzip())
+        response.vary.add('Accept-Encoding')
+    else:
+        response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+@app.after_request
+def gzip_json_response(response):
+    """Gzip larger JSON responses when the client accepts gzip."""
+    if (response.status_code != 200
+            or response.direct_passthrough
+            or response.mimetype != 'application/json'
+            or 'Content-Encoding' in response.headers
+            or not accepts_gzip()):
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+    etag, weak = response.get_etag()
+    compressed = _gzip_cache.get(etag) if etag else None
+    if compressed is None:
+        compressed = gzip.compress(body, compresslevel=6)
+        if etag:
+            if len(_gzip_cache) >= RESPONSE_CACHE_SIZE:
+                _gzip_cache.clear()
+            _gzip_cache[etag] = compressed
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    # The gzipped bytes differ from the identity body, so the validator becomes weak
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+# Characters jsonify writes as \uXXXX escapes (Flask's provider uses ensure_ascii):
+# everything outside printable ASCII. Control characters are already escaped the
+# same way by every encoder used here, so only these need rewriting.
+NON_ASCII_RE = re.compile('[^\x00-\x7e]')
+
+
+def escape_non_ascii(text):
+    """Escape non-ASCII characters in JSON text as \\uXXXX, matching jsonify's output."""
+    return NON_ASCII_RE.sub(lambda match: json.dumps(match.group())[1:-1], text)
+
+
+def json_response(data, status=200):
+    """
+    Build a JSON response like jsonify(), encoding with orjson when it is installed.
+    Keys are sorted, a trailing newline added and non-ASCII characters escaped (orjson
+    writes them raw), so the body and its ETag don't depend on whether orjson is present.
+    """
+    if orjson is None:
+        response = jsonify(data)
+        response.status_code = status
+        return response
+    body = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return app.response_class(
+        escape_non_ascii(body.decode()),
+        status=status,
+        mimetype='application/json'
+    )
+
+
 def init_database():
     """Initialize the SQLite database with the results table."""
     conn = get_db_connection()
     try:
+        # Write-ahead logging lets readers run alongside a writer; the mode is
+        # stored in the database file, so it only needs to be set once
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS results (
                 date TEXT NOT NULL,
@@ -56,21 +306,54 @@ def init_database():
                 PRIMARY KEY (date, username)
             )
         """)
+        # Covers the leaderboard queries and returns each date's rows already in
+        # time, username order; it also serves lookups by date alone
         conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_date ON results(date)
+            CREATE INDEX IF NOT EXISTS idx_date_time_user ON results(date, time, username)
+        """)
+        conn.execute("DROP INDEX IF EXISTS idx_date")
+        # Covers the per-user streak and median-time queries; SQLite scans it in
+        # either direction, so it serves both ORDER BY date ASC and DESC
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_username_date ON results(username, date, completion_timestamp)
         """)
         # Add completion_timestamp column if it doesn't exist (for existing databases)
-        try:
-            conn.execute("ALTER TABLE results ADD COLUMN completion_timestamp TEXT")
-            conn.commit()
-        except sqlite3.OperationalError:
-            # Column already exists, ignore
-            pass
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(results)")}
+        if 'completion_timestamp' not in columns:
+            try:
+                conn.execute("ALTER TABLE results ADD COLUMN completion_timestamp TEXT")
+            except sqlite3.OperationalError:
+                # Another worker added it first
+                pass
         conn.commit()
     finally:
         conn.close()
 
 
+# Create the schema once per process at import rather than on every request
+init_database()
+
+
+def parse_iso_date(date_str):
+    """
+    Parse a YYYY-MM-DD date string, raising ValueError for anything else.
+    Faster than strptime; the round trip rejects the other forms fromisoformat accepts.
+    It is also stricter than strptime('%Y-%m-%d'): unpadded dates such as 2026-1-2
+    are rejected, so /data/2026-1-2.json is a 404 and /migrate skips such files.
+    """
+    parsed = date.fromisoformat(date_str)
+    if parsed.isoformat() != date_str:
+        raise ValueError(f"Not a YYYY-MM-DD date: {date_str}")
+    return parsed
+
+
+@lru_cache(maxsize=1024)
+def noon_pacific_utc_iso(day):
+    """ISO UTC timestamp for noon Pacific time on day (used for results without a real one)."""
+    noon_pacific = PACIFIC.localize(datetime(day.year, day.month, day.day, 12, 0, 0))
+    return noon_pacific.astimezone(pytz.UTC).isoformat()
+
+
 def load_non_credit_dates():
     """
     Load the set of dates that do not count for credit.
@@ -104,9 +387,7 @@ def collect_valid_streak_dates(rows, pacific, utc, min_streak_date, non_credit_d
     Non-credit dates are excluded even if solved (they never add to streak length).
     """
     valid_dates = set()
-    for row in rows:
-        puzzle_date_str = row['date']
-        completion_timestamp_str = row['completion_timestamp']
+    for puzzle_date_str, completion_timestamp_str in rows:
         try:
             puzzle_date = datetime.strptime(puzzle_date_str, '%Y-%m-%d').date()
 
@@ -187,6 +468,24 @@ def calculate_max_streak(valid_dates, non_credit_dates):
     return max(max_streak, current_streak)
 
 
+def fetch_completions_by_user(conn, usernames, min_streak_date):
+    """
+    Fetch (date, completion_timestamp) rows for several users with a single query.
+    Returns {username: rows}; users without completions are absent.
+    """
+    size = next((n for n in IN_LIST_SIZES if n >= len(usernames)), len(usernames))
+    padding = [None] * (size - len(usernames))
+    placeholders = ','.join('?' * size)
+    rows_by_user = defaultdict(list)
+    for username, puzzle_date_str, completion_timestamp_str in conn.execute(
+        f"SELECT username, date, completion_timestamp FROM results "
+        f"WHERE username IN ({placeholders}) AND date >= ? AND completion_timestamp IS NOT NULL",
+        (*usernames, *padding, min_streak_date.isoformat())
+    ):
+        rows_by_user[username].append((puzzle_date_str, completion_timestamp_str))
+    return rows_by_user
+
+
 @app.route('/results', methods=['GET'])
 def store_results():
     """
@@ -202,51 +501,43 @@ def store_results():
     Returns JSON response with status.
     """
     try:
-        # Initialize database if it doesn't exist
-        init_database()
-        
         # Get parameters from query string
         username = request.args.get('user')
-        time_score = request.args.get('time')
-        date = request.args.get('date')
+        # None if time is missing or not an integer
+        time_score = request.args.get('time', type=int)
+        requested_date = request.args.get('date')
         
         # Validate parameters
         if not username:
             return jsonify({'error': 'Missing required parameter: user'}), 400
         
-        if not time_score:
-            return jsonify({'error': 'Missing required parameter: time'}), 400
-        
-        # Validate time is an integer
-        try:
-            time_score = int(time_score)
-        except ValueError:
+        if time_score is None:
+            if not request.args.get('time'):
+                return jsonify({'error': 'Missing required parameter: time'}), 400
             return jsonify({'error': 'Parameter time must be an integer'}), 400
         
         # Generate current date as submission date (YYYY-MM-DD format)
-        if date:
-            submission_date = date
+        if requested_date:
+            submission_date = requested_date
         else:
-            submission_date = datetime.now().strftime('%Y-%m-%d')
+            submission_date = date.today().isoformat()
         
         # Get current timestamp in UTC (stored as ISO format string)
         completion_timestamp = datetime.now(pytz.UTC).isoformat()
         
         # Store in SQLite database
-        conn = get_db_connection()
-        try:
-            conn.execute(
-                "INSERT OR REPLACE INTO results (date, username, time, completion_timestamp) VALUES (?, ?, ?, ?)",
-                (submission_date, username, time_score, completion_timestamp)
-            )
-            conn.commit()
-            app.logger.info(f"Stored result for user {username}: {time_score} at {submission_date} (completed at {completion_timestamp})")
-        except Exception as db_error:
-            app.logger.error(f"Database error storing result: {str(db_error)}")
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        with get_writer() as conn:
+            try:
+                conn.execute(
+                    UPSERT_RESULT_SQL,
+                    (submission_date, username, time_score, completion_timestamp)
+                )
+                conn.commit()
+                app.logger.info(f"Stored result for user {username}: {time_score} at {submission_date} (completed at {completion_timestamp})")
+            except Exception as db_error:
+                app.logger.error(f"Database error storing result: {str(db_error)}")
+                conn.rollback()
+                raise
         
         return jsonify({
             'status': 'success',
@@ -283,21 +574,27 @@ def list_crosswords():
         if not CROSSWORDS_DIR.exists():
             return jsonify({'error': 'Crosswords directory not found'}), 404
         
-        # Get all JSON files in the crosswords directory
-        json_files = []
-        for file_path in CROSSWORDS_DIR.glob('*.json'):
-            json_files.append(file_path.name)
-        
-        # Sort the files for consistent ordering
-        json_files.sort()
+        # Reuse the cached listing unless the directory changed since it was built
+        dir_mtime = CROSSWORDS_DIR.stat().st_mtime_ns
+        cached = get_cached_response(request.path, dir_mtime)
+        if cached is None:
+            # Get all JSON files in the crosswords directory (names only, no per-file stat)
+            with os.scandir(CROSSWORDS_DIR) as entries:
+                json_files = [entry.name for entry in entries if entry.name.endswith('.json')]
+            
+            # Sort the files for consistent ordering
+            json_files.sort()
+            
+            app.logger.info(f"Found {len(json_files)} crossword files")
+            
+            body = json_response({
+                'status': 'success',
+                'count': len(json_files),
+                'files': json_files
+            }).get_data()
+            cached = cache_response(request.path, dir_mtime, body)
         
-        app.logger.info(f"Found {len(json_files)} crossword files")
-        
-        return jsonify({
-            'status': 'success',
-            'count': len(json_files),
-            'files': json_files
-        }), 200
+        return cached_json_response(*cached)
         
     except Exception as e:
         app.logger.error(f"Error listing crosswords: {str(e)}")
@@ -320,38 +617,33 @@ def get_leaderboard(date):
     or {username: int} for backward compatibility if no timestamp exists.
     """
     try:
-        # Initialize database if it doesn't exist
-        init_database()
+        # Serve the cached body unless the database changed since it was built
+        version = get_data_version()
+        cached = get_cached_response(request.path, version)
+        if cached is not None:
+            return cached_json_response(*cached)
         
-        conn = get_db_connection()
-        try:
+        with get_reader() as conn:
             rows = conn.execute(
-                "SELECT username, time, completion_timestamp FROM results WHERE date = ? ORDER BY time ASC, username ASC",
+                "SELECT username, time, completion_timestamp FROM results WHERE date = ? AND time IS NOT NULL ORDER BY time ASC, username ASC",
                 (date,)
             ).fetchall()
             
             # Convert to dictionary format with completion_timestamp if available
+            # (time is an INTEGER column, so it already comes back as an int)
             leaderboard_data = {}
-            for row in rows:
-                # Ensure time is a valid integer
-                time_value = row['time']
-                if time_value is None:
-                    continue  # Skip invalid entries
-                
-                completion_timestamp = row['completion_timestamp']
-                # Check if completion_timestamp exists and is not empty
-                if completion_timestamp and completion_timestamp.strip():
-                    leaderboard_data[row['username']] = {
-                        'time': int(time_value),
+            for username, time_value, completion_timestamp in rows:
+                if completion_timestamp:
+                    leaderboard_data[username] = {
+                        'time': time_value,
                         'completion_timestamp': completion_timestamp
                     }
                 else:
                     # Backward compatibility: return just time if no timestamp
-                    leaderboard_data[row['username']] = int(time_value)
+                    leaderboard_data[username] = time_value
             
-            return jsonify(leaderboard_data), 200
-        finally:
-            conn.close()
+            body = json_response(leaderboard_data).get_data()
+            return cached_json_response(*cache_response(request.path, version, body))
             
     except Exception as e:
         app.logger.error(f"Error fetching leaderboard for {date}: {str(e)}")
@@ -367,27 +659,27 @@ def get_all_leaderboards():
     Returns JSON in format {date: {username: time}} for all dates.
     """
     try:
-        # Initialize database if it doesn't exist
-        init_database()
+        # Serve the cached body unless the database changed since it was built
+        version = get_data_version()
+        cached = get_cached_response(request.path, version)
+        if cached is not None:
+            return cached_json_response(*cached)
         
-        conn = get_db_connection()
-        try:
-            # Fetch all results ordered by date, then time
-            rows = conn.execute(
-                "SELECT date, username, time FROM results ORDER BY date ASC, time ASC, username ASC"
-            ).fetchall()
-            
-            # Group by date
-            leaderboards = {}
-            for row in rows:
-                date = row['date']
-                if date not in leaderboards:
-                    leaderboards[date] = {}
-                leaderboards[date][row['username']] = row['time']
+        with get_reader() as conn:
+            # Let SQLite build each date's {username: time} object. Rows reach the
+            # aggregate in username order, so keys come out sorted like jsonify's.
+            rows = conn.execute("""
+                SELECT date, json_group_object(username, time)
+                FROM (SELECT date, username, time FROM results ORDER BY date ASC, username ASC)
+                GROUP BY date
+                ORDER BY date ASC
+            """).fetchall()
             
-            return jsonify(leaderboards), 200
-        finally:
-            conn.close()
+            # Stitch the per-date objects into one document without decoding them.
+            # json_group_object writes non-ASCII raw; escape it as jsonify would.
+            body = '{' + ','.join(f'{json.dumps(day)}:{scores}' for day, scores in rows) + '}\n'
+            body = escape_non_ascii(body)
+            return cached_json_response(*cache_response(request.path, version, body))
             
     except Exception as e:
         app.logger.error(f"Error fetching all leaderboards: {str(e)}")
@@ -403,13 +695,9 @@ def get_average_time(username):
     Returns JSON with average_time in seconds (using median calculation), or null if user has no completions.
     """
     try:
-        # Initialize database if it doesn't exist
-        init_database()
-        
         non_credit_dates = {d.isoformat() for d in load_non_credit_dates()}
         
-        conn = get_db_connection()
-        try:
+        with get_reader() as conn:
             # Fetch all times for this user (exclude non-credit dates)
             rows = conn.execute(
                 "SELECT date, time FROM results WHERE username = ? AND time IS NOT NULL",
@@ -421,9 +709,9 @@ def get_average_time(username):
             
             # Calculate median, skipping non-credit days
             times = [
-                int(row['time'])
-                for row in rows
-                if row['time'] is not None and row['date'] not in non_credit_dates
+                int(time_value)
+                for date_str, time_value in rows
+                if time_value is not None and date_str not in non_credit_dates
             ]
             if not times:
                 return jsonify({'average_time': None}), 200
@@ -439,8 +727,6 @@ def get_average_time(username):
                 median_time = times_sorted[n // 2]
             
             return jsonify({'average_time': median_time}), 200
-        finally:
-            conn.close()
             
     except Exception as e:
         app.logger.error(f"Error calculating median time for {username}: {str(e)}")
@@ -466,43 +752,35 @@ def migrate_json_to_sqlite():
     Returns JSON with migration status.
     """
     try:
-        # Initialize database
-        init_database()
-        
         # Backfill existing records that don't have completion_timestamp
-        conn = get_db_connection()
         backfilled_count = 0
-        try:
+        with get_writer() as conn:
             # Find records without completion_timestamp
             rows_without_timestamp = conn.execute(
                 "SELECT date, username FROM results WHERE completion_timestamp IS NULL"
             ).fetchall()
             
             if rows_without_timestamp:
-                pacific = pytz.timezone('America/Los_Angeles')
-                for row in rows_without_timestamp:
-                    date_str = row['date']
+                updates = []
+                for date_str, username in rows_without_timestamp:
                     try:
                         # Parse the date and set to noon Pacific time
-                        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                        noon_pacific = pacific.localize(datetime(date_obj.year, date_obj.month, date_obj.day, 12, 0, 0))
-                        # Convert to UTC and format as ISO string
-                        completion_timestamp = noon_pacific.astimezone(pytz.UTC).isoformat()
+                        date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
+                        completion_timestamp = noon_pacific_utc_iso(date_obj)
                         
-                        # Update the record
-                        conn.execute(
-                            "UPDATE results SET completion_timestamp = ? WHERE date = ? AND username = ?",
-                            (completion_timestamp, date_str, row['username'])
-                        )
-                        backfilled_count += 1
+                        updates.append((completion_timestamp, date_str, username))
                     except ValueError:
                         # Skip invalid date formats
                         app.logger.warning(f"Invalid date format in database: {date_str}")
                 
+                # Update the records in one batch
+                conn.executemany(
+                    "UPDATE results SET completion_timestamp = ? WHERE date = ? AND username = ?",
+                    updates
+                )
+                backfilled_count = len(updates)
                 conn.commit()
                 app.logger.info(f"Backfilled {backfilled_count} existing records with completion timestamps")
-        finally:
-            conn.close()
         
         # Scan data directory for JSON files
         json_files = list(DATA_DIR.glob('*.json'))
@@ -520,8 +798,7 @@ def migrate_json_to_sqlite():
         migrated_files = 0
         errors = []
         
-        conn = get_db_connection()
-        try:
+        with get_writer() as conn:
             for json_file in json_files:
                 # Extract date from filename (YYYY-MM-DD.json)
                 date_match = json_file.stem
@@ -531,36 +808,31 @@ def migrate_json_to_sqlite():
                 
                 try:
                     # Validate date format
-                    datetime.strptime(date_match, '%Y-%m-%d')
+                    date_obj = parse_iso_date(date_match)
                 except ValueError:
                     # Skip invalid date formats
                     continue
                 
                 try:
-                    # Load JSON file
-                    with open(json_file, 'r') as f:
-                        date_data = json.load(f)
+                    # Load JSON file (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+                    with open(json_file, 'rb') as f:
+                        date_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
                     
-                    # Create noon Pacific time for this date
-                    pacific = pytz.timezone('America/Los_Angeles')
-                    # Parse the date and set to noon Pacific time
-                    date_obj = datetime.strptime(date_match, '%Y-%m-%d')
-                    noon_pacific = pacific.localize(datetime(date_obj.year, date_obj.month, date_obj.day, 12, 0, 0))
-                    # Convert to UTC and format as ISO string
-                    completion_timestamp = noon_pacific.astimezone(pytz.UTC).isoformat()
+                    # Set to noon Pacific time on the parsed date
+                    completion_timestamp = noon_pacific_utc_iso(date_obj)
                     
-                    # Insert all entries
-                    file_records = 0
+                    # Insert all entries in one batch
+                    rows = []
                     for username, time_score in date_data.items():
                         try:
-                            time_score = int(time_score)
-                            conn.execute(
-                                "INSERT OR REPLACE INTO results (date, username, time, completion_timestamp) VALUES (?, ?, ?, ?)",
-                                (date_match, username, time_score, completion_timestamp)
-                            )
-                            file_records += 1
+                            rows.append((date_match, username, int(time_score), completion_timestamp))
                         except (ValueError, TypeError) as e:
                             app.logger.warning(f"Invalid time value in {json_file.name} for user {username}: {e}")
+                    conn.executemany(
+                        UPSERT_RESULT_SQL,
+                        rows
+                    )
+                    file_records = len(rows)
                     
                     if file_records > 0:
                         migrated_files += 1
@@ -575,8 +847,6 @@ def migrate_json_to_sqlite():
                     app.logger.error(f"Error migrating {json_file.name}: {e}")
             
             conn.commit()
-        finally:
-            conn.close()
         
         response_data = {
             'status': 'success',
@@ -614,20 +884,23 @@ def data_files(filename):
         date_match = filename[:-5]  # Remove .json extension
         try:
             # Validate date format
-            datetime.strptime(date_match, '%Y-%m-%d')
+            parse_iso_date(date_match)
+            # Serve the cached body unless the database changed since it was built
+            version = get_data_version()
+            cached = get_cached_response(request.path, version)
+            if cached is not None:
+                return cached_json_response(*cached)
             # Try to get from database
-            conn = get_db_connection()
-            try:
+            with get_reader() as conn:
                 rows = conn.execute(
                     "SELECT username, time FROM results WHERE date = ? ORDER BY time ASC, username ASC",
                     (date_match,)
                 ).fetchall()
                 
                 if rows:
-                    leaderboard_data = {row['username']: row['time'] for row in rows}
-                    return jsonify(leaderboard_data), 200
-            finally:
-                conn.close()
+                    leaderboard_data = dict(rows)
+                    body = json_response(leaderboard_data).get_data()
+                    return cached_json_response(*cache_response(request.path, version, body))
         except ValueError:
             # Not a valid date format, fall through to 404
             pass
@@ -653,9 +926,6 @@ def get_streaks():
     Non-credit days are skipped (do not break or extend streaks).
     """
     try:
-        # Initialize database if it doesn't exist
-        init_database()
-        
         # Get usernames from request body
         if not request.is_json:
             return jsonify({'error': 'Request must be JSON'}), 400
@@ -673,36 +943,28 @@ def get_streaks():
         if len(usernames) > 100:
             return jsonify({'error': 'Maximum 100 usernames per request'}), 400
         
-        pacific = pytz.timezone('America/Los_Angeles')
-        utc = pytz.UTC
-        min_streak_date = datetime(2026, 1, 1).date()
-        current_date = datetime.now(pacific).date()
+        current_date = datetime.now(PACIFIC).date()
         non_credit_dates = load_non_credit_dates()
         
-        conn = get_db_connection()
-        try:
+        with get_reader() as conn:
+            rows_by_user = fetch_completions_by_user(conn, usernames, MIN_STREAK_DATE)
             streaks = {}
             
             for username in usernames:
-                rows = conn.execute(
-                    "SELECT date, completion_timestamp FROM results WHERE username = ? AND completion_timestamp IS NOT NULL ORDER BY date DESC",
-                    (username,)
-                ).fetchall()
+                rows = rows_by_user.get(username)
                 
                 if not rows:
                     streaks[username] = 0
                     continue
                 
                 valid_dates = collect_valid_streak_dates(
-                    rows, pacific, utc, min_streak_date, non_credit_dates
+                    rows, PACIFIC, pytz.UTC, MIN_STREAK_DATE, non_credit_dates
                 )
                 streaks[username] = count_current_streak(
-                    valid_dates, current_date, min_streak_date, non_credit_dates
+                    valid_dates, current_date, MIN_STREAK_DATE, non_credit_dates
                 )
             
             return jsonify(streaks), 200
-        finally:
-            conn.close()
             
     except Exception as e:
         app.logger.error(f"Error calculating streaks: {str(e)}")
@@ -720,32 +982,23 @@ def get_longest_streak(username):
     Returns JSON with longest streak count.
     """
     try:
-        # Initialize database if it doesn't exist
-        init_database()
-        
-        pacific = pytz.timezone('America/Los_Angeles')
-        utc = pytz.UTC
-        min_streak_date = datetime(2026, 1, 1).date()
         non_credit_dates = load_non_credit_dates()
         
-        conn = get_db_connection()
-        try:
+        with get_reader() as conn:
             rows = conn.execute(
-                "SELECT date, completion_timestamp FROM results WHERE username = ? AND completion_timestamp IS NOT NULL ORDER BY date DESC",
-                (username,)
+                "SELECT date, completion_timestamp FROM results WHERE username = ? AND date >= ? AND completion_timestamp IS NOT NULL ORDER BY date DESC",
+                (username, MIN_STREAK_DATE.isoformat())
             ).fetchall()
             
             if not rows:
                 return jsonify({'longest_streak': 0}), 200
             
             valid_dates = collect_valid_streak_dates(
-                rows, pacific, utc, min_streak_date, non_credit_dates
+                rows, PACIFIC, pytz.UTC, MIN_STREAK_DATE, non_credit_dates
             )
             longest_streak = calculate_max_streak(valid_dates, non_credit_dates)
             
             return jsonify({'longest_streak': longest_streak}), 200
-        finally:
-            conn.close()
             
     except Exception as e:
         app.logger.error(f"Error calculating longest streak for {username}: {str(e)}")
@@ -766,9 +1019,6 @@ def get_max_streaks():
     Non-credit days bridge gaps but do not count toward streak length.
     """
     try:
-        # Initialize database if it doesn't exist
-        init_database()
-        
         # Get usernames from request body
         if not request.is_json:
             return jsonify({'error': 'Request must be JSON'}), 400
@@ -787,44 +1037,36 @@ def get_max_streaks():
         if len(usernames) > 100:
             return jsonify({'error': 'Maximum 100 usernames per request'}), 400
         
-        pacific = pytz.timezone('America/Los_Angeles')
-        utc = pytz.UTC
-        min_streak_date = datetime(2026, 1, 1).date()
         non_credit_dates = load_non_credit_dates()
         
         # Set date range based on year filter
         if year:
             year_start = datetime(int(year), 1, 1).date()
             year_end = datetime(int(year), 12, 31).date()
-            if year_start < min_streak_date:
-                year_start = min_streak_date
+            if year_start < MIN_STREAK_DATE:
+                year_start = MIN_STREAK_DATE
         else:
-            year_start = min_streak_date
-            year_end = datetime.now(pacific).date()
+            year_start = MIN_STREAK_DATE
+            year_end = datetime.now(PACIFIC).date()
         
-        conn = get_db_connection()
-        try:
+        with get_reader() as conn:
+            rows_by_user = fetch_completions_by_user(conn, usernames, MIN_STREAK_DATE)
             max_streaks = {}
             
             for username in usernames:
-                rows = conn.execute(
-                    "SELECT date, completion_timestamp FROM results WHERE username = ? AND completion_timestamp IS NOT NULL ORDER BY date ASC",
-                    (username,)
-                ).fetchall()
+                rows = rows_by_user.get(username)
                 
                 if not rows:
                     max_streaks[username] = 0
                     continue
                 
                 valid_dates = collect_valid_streak_dates(
-                    rows, pacific, utc, min_streak_date, non_credit_dates,
+                    rows, PACIFIC, pytz.UTC, MIN_STREAK_DATE, non_credit_dates,
                     year_start=year_start, year_end=year_end
                 )
                 max_streaks[username] = calculate_max_streak(valid_dates, non_credit_dates)
             
             return jsonify(max_streaks), 200
-        finally:
-            conn.close()
             
     except Exception as e:
         app.logger.error(f"Error calculating max streaks: {str(e)}")
@@ -842,35 +1084,26 @@ def get_streak(username):
     Returns JSON with streak count.
     """
     try:
-        # Initialize database if it doesn't exist
-        init_database()
-        
-        pacific = pytz.timezone('America/Los_Angeles')
-        utc = pytz.UTC
-        min_streak_date = datetime(2026, 1, 1).date()
-        current_date = datetime.now(pacific).date()
+        current_date = datetime.now(PACIFIC).date()
         non_credit_dates = load_non_credit_dates()
         
-        conn = get_db_connection()
-        try:
+        with get_reader() as conn:
             rows = conn.execute(
-                "SELECT date, completion_timestamp FROM results WHERE username = ? AND completion_timestamp IS NOT NULL ORDER BY date DESC",
-                (username,)
+                "SELECT date, completion_timestamp FROM results WHERE username = ? AND date >= ? AND completion_timestamp IS NOT NULL ORDER BY date DESC",
+                (username, MIN_STREAK_DATE.isoformat())
             ).fetchall()
             
             if not rows:
                 return jsonify({'streak': 0}), 200
             
             valid_dates = collect_valid_streak_dates(
-                rows, pacific, utc, min_streak_date, non_credit_dates
+                rows, PACIFIC, pytz.UTC, MIN_STREAK_DATE, non_credit_dates
             )
             streak = count_current_streak(
-                valid_dates, current_date, min_streak_date, non_credit_dates
+                valid_dates, current_date, MIN_STREAK_DATE, non_credit_dates
             )
             
             return jsonify({'streak': streak}), 200
-        finally:
-            conn.close()
             
     except Exception as e:
         app.logger.error(f"Error calculating streak for {username}: {str(e)}")
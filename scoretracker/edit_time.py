@@ -6,37 +6,92 @@ Usage:
     python edit_time.py <player> <date> <time>
     python edit_time.py --player <player> --date <date> --time <time>
     python edit_time.py --player <player> --date <date> --delete
+    python edit_time.py --batch <file.csv>
 
 Examples:
     python edit_time.py alice 2024-01-15 300
     python edit_time.py --player bob --date 2024-01-15 --time 250
     python edit_time.py --player alice --date 2024-01-15 --delete
+    python edit_time.py --batch times.csv
 """
 
-import argparse
+import datetime
+import os
 import sqlite3
 import sys
-from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
 
+# argparse and csv are imported where they're used: most runs are a single edit,
+# and importing edit_time from other code shouldn't pay for them at all
 
-# Database path - matches app.py
-DATA_DIR = Path(__file__).parent / ".." / "data"
-DB_PATH = DATA_DIR / "statistics.db"
+
+# Database path - matches app.py (plain strings, so pathlib isn't imported)
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+DB_PATH = os.path.join(DATA_DIR, "statistics.db")
+
+# Set once the data directory / schema have been created in this process
+_data_dir_ready = False
+_initialized = False
+
+# SQL shared by the single-row and fallback paths, defined once alongside the upsert
+SELECT_TIME_SQL = "SELECT time FROM results WHERE date = ? AND username = ?"
+DELETE_TIME_SQL = "DELETE FROM results WHERE date = ? AND username = ?"
+DELETE_RETURNING_TIME_SQL = DELETE_TIME_SQL + " RETURNING time"
+
+# Update the time in place on conflict; unlike INSERT OR REPLACE this keeps the
+# row's other columns (completion_timestamp). Upsert needs SQLite 3.24+.
+if sqlite3.sqlite_version_info >= (3, 24, 0):
+    UPSERT_TIME_SQL = (
+        "INSERT INTO results (date, username, time) VALUES (?, ?, ?) "
+        "ON CONFLICT(date, username) DO UPDATE SET time = excluded.time"
+    )
+else:
+    UPSERT_TIME_SQL = "INSERT OR REPLACE INTO results (date, username, time) VALUES (?, ?, ?)"
+
+# DELETE ... RETURNING needs SQLite 3.35+; older builds fall back to SELECT + DELETE
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 
 def get_db_connection():
     """Get a connection to the SQLite database."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
+    global _data_dir_ready
+    # Ensure data directory exists (checked once per process)
+    if not _data_dir_ready:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        _data_dir_ready = True
+    # Autocommit mode: writes open their own transaction with BEGIN IMMEDIATE,
+    # taking the write lock up front instead of upgrading a read lock mid-way
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    # Same per-connection settings as app.py: with WAL, NORMAL sync avoids an
+    # fsync on every commit; the cache is only allocated as pages are read
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-8000")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
-def init_database():
-    """Initialize the SQLite database with the results table."""
-    conn = get_db_connection()
+def init_database(conn=None):
+    """Initialize the SQLite database with the results table.
+
+    Runs at most once per process; pass ``conn`` to reuse an open connection.
+    """
+    global _initialized
+    if _initialized:
+        return
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
     try:
+        # A database that already has the table (e.g. one set up by app.py)
+        # needs no DDL at all
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'results'"
+        ).fetchone():
+            _initialized = True
+            return
+        # Write-ahead logging is stored in the database file, so it only needs
+        # to be set once (app.py sets it too)
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS results (
                 date TEXT NOT NULL,
@@ -45,37 +100,55 @@ def init_database():
                 PRIMARY KEY (date, username)
             )
         """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_date ON results(date)
-        """)
+        # The primary key index already leads with date, so a separate date index
+        # only adds work to every write (app.py drops it as well)
+        conn.execute("DROP INDEX IF EXISTS idx_date")
         conn.commit()
+        _initialized = True
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
+@lru_cache(maxsize=256)
 def validate_date(date_str):
     """Validate that the date string is in YYYY-MM-DD format."""
+    # Faster than strptime; the round trip rejects the other forms fromisoformat accepts
     try:
-        datetime.strptime(date_str, '%Y-%m-%d')
-        return True
+        return datetime.date.fromisoformat(date_str).isoformat() == date_str
     except ValueError:
         return False
 
 
-def get_current_time(player, date):
+def _is_valid_time(value):
+    """Check that a time is a non-negative int (bool is an int subclass, so exclude it)."""
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def _select_time(conn, player, date):
+    """Read the current time for a player on a date using an open connection."""
+    row = conn.execute(
+        SELECT_TIME_SQL,
+        (date, player)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def get_current_time(player, date, conn=None):
     """Get the current time for a player on a specific date."""
-    conn = get_db_connection()
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
     try:
-        row = conn.execute(
-            "SELECT time FROM results WHERE date = ? AND username = ?",
-            (date, player)
-        ).fetchone()
-        return row['time'] if row else None
+        # Initialize database if it doesn't exist
+        init_database(conn)
+        return _select_time(conn, player, date)
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
-def edit_time(player, date, new_time):
+def edit_time(player, date, new_time, preview=False, conn=None):
     """
     Edit a player's time for a specific date.
     
@@ -83,33 +156,43 @@ def edit_time(player, date, new_time):
         player: Username (string)
         date: Date in YYYY-MM-DD format (string)
         new_time: New time value (integer)
+        preview: Validate and describe the change without writing it
+        conn: Open connection to use instead of opening one (optional)
     
     Returns:
         tuple: (success: bool, message: str, old_time: int or None)
     """
-    # Initialize database if it doesn't exist
-    init_database()
-    
     # Validate date format
     if not validate_date(date):
         return False, f"Invalid date format: {date}. Expected YYYY-MM-DD format.", None
     
-    # Validate time is an integer
-    try:
-        new_time = int(new_time)
-        if new_time < 0:
-            return False, f"Time must be a non-negative integer, got: {new_time}", None
-    except ValueError:
-        return False, f"Time must be an integer, got: {new_time}", None
-    
-    # Get current time (if exists)
-    old_time = get_current_time(player, date)
+    # Validate time is a non-negative integer (argparse has already converted it)
+    if not _is_valid_time(new_time):
+        return False, f"Time must be a non-negative integer, got: {new_time!r}", None
     
-    # Update or insert the record
-    conn = get_db_connection()
+    old_time = None
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
     try:
+        # Initialize database if it doesn't exist
+        init_database(conn)
+        
+        if not preview:
+            conn.execute("BEGIN IMMEDIATE")
+        
+        # Read the current time (if exists) and write in the same transaction
+        old_time = _select_time(conn, player, date)
+        
+        if preview:
+            if old_time is not None:
+                message = f"Current time for {player} on {date}: {old_time}\nNew time: {new_time}"
+            else:
+                message = f"No existing record for {player} on {date}\nWill create new record with time: {new_time}"
+            return True, message, old_time
+        
         conn.execute(
-            "INSERT OR REPLACE INTO results (date, username, time) VALUES (?, ?, ?)",
+            UPSERT_TIME_SQL,
             (date, player, new_time)
         )
         conn.commit()
@@ -123,57 +206,161 @@ def edit_time(player, date, new_time):
     except Exception as e:
         conn.rollback()
         return False, f"Database error: {str(e)}", old_time
+    finally:
+        if own_conn:
+            conn.close()
+
+
+def edit_times_bulk(items):
+    """
+    Set many players' times in a single transaction.
+    
+    Args:
+        items: Iterable of (player, date, time) tuples
+    
+    Returns:
+        tuple: (success: bool, message: str, count: int)
+    """
+    rows = []
+    for number, (player, date, new_time) in enumerate(items, start=1):
+        if not validate_date(date):
+            return False, f"Row {number}: Invalid date format: {date}. Expected YYYY-MM-DD format.", 0
+        if not _is_valid_time(new_time):
+            return False, f"Row {number}: Time must be a non-negative integer, got: {new_time!r}", 0
+        rows.append((date, player, new_time))
+    
+    conn = get_db_connection()
+    try:
+        # Initialize database if it doesn't exist
+        init_database(conn)
+        
+        # One executemany and one commit for the whole batch
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            UPSERT_TIME_SQL,
+            rows
+        )
+        conn.commit()
+        return True, f"Saved {len(rows)} records", len(rows)
+    except Exception as e:
+        conn.rollback()
+        return False, f"Database error: {str(e)}", 0
     finally:
         conn.close()
 
 
-def delete_time(player, date):
+def read_batch_file(path):
+    """
+    Read (player, date, time) rows from a CSV file.
+    
+    Blank lines and an optional "player,date,time" header (the first
+    non-blank row) are skipped.
+    Raises ValueError for rows that don't have exactly three columns or
+    whose time isn't an integer.
+    """
+    import csv
+    
+    items = []
+    first_row = True
+    with open(path, newline='') as f:
+        for line_number, row in enumerate(csv.reader(f), start=1):
+            if not row:
+                continue
+            if len(row) != 3:
+                raise ValueError(f"Line {line_number}: expected player,date,time, got: {','.join(row)}")
+            row = [value.strip() for value in row]
+            is_header = first_row and row == ['player', 'date', 'time']
+            first_row = False
+            if is_header:
+                continue
+            player, date, time_value = row
+            try:
+                time_value = int(time_value)
+            except ValueError:
+                raise ValueError(f"Line {line_number}: time must be an integer, got: {time_value}")
+            items.append((player, date, time_value))
+    return items
+
+
+def delete_time(player, date, preview=False, conn=None):
     """
     Delete a player's time for a specific date.
     
     Args:
         player: Username (string)
         date: Date in YYYY-MM-DD format (string)
+        preview: Validate and describe the deletion without performing it;
+            a missing record is reported as success with old_time None
+        conn: Open connection to use instead of opening one (optional)
     
     Returns:
         tuple: (success: bool, message: str, old_time: int or None)
     """
-    # Initialize database if it doesn't exist
-    init_database()
-    
     # Validate date format
     if not validate_date(date):
         return False, f"Invalid date format: {date}. Expected YYYY-MM-DD format.", None
     
-    # Get current time (if exists)
-    old_time = get_current_time(player, date)
-    
-    if old_time is None:
-        return False, f"No record found for {player} on {date}", None
-    
-    # Delete the record
-    conn = get_db_connection()
+    old_time = None
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db_connection()
     try:
-        cursor = conn.execute(
-            "DELETE FROM results WHERE date = ? AND username = ?",
-            (date, player)
-        )
-        conn.commit()
+        # Initialize database if it doesn't exist
+        init_database(conn)
         
-        if cursor.rowcount > 0:
-            message = f"Deleted {player}'s time on {date} (was {old_time})"
+        if preview:
+            old_time = _select_time(conn, player, date)
+            if old_time is not None:
+                message = f"Current time for {player} on {date}: {old_time}\nThis record will be deleted."
+            else:
+                message = f"No existing record for {player} on {date}"
             return True, message, old_time
+        
+        conn.execute("BEGIN IMMEDIATE")
+        
+        if SUPPORTS_RETURNING:
+            # Delete the record and get its time back in one statement
+            row = conn.execute(
+                DELETE_RETURNING_TIME_SQL,
+                (date, player)
+            ).fetchone()
+            conn.commit()
+            
+            if row is None:
+                return False, f"No record found for {player} on {date}", None
+            old_time = row[0]
         else:
-            return False, f"No record found for {player} on {date}", old_time
+            # Get current time (if exists)
+            old_time = _select_time(conn, player, date)
+            
+            if old_time is None:
+                conn.rollback()
+                return False, f"No record found for {player} on {date}", None
+            
+            # Delete the record
+            cursor = conn.execute(
+                DELETE_TIME_SQL,
+                (date, player)
+            )
+            conn.commit()
+            
+            if cursor.rowcount == 0:
+                return False, f"No record found for {player} on {date}", old_time
+        
+        message = f"Deleted {player}'s time on {date} (was {old_time})"
+        return True, message, old_time
     except Exception as e:
         conn.rollback()
         return False, f"Database error: {str(e)}", old_time
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
 
 
 def main():
     """Main entry point for the command-line utility."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Edit or delete a player's time for a specific date",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -184,6 +371,7 @@ Examples:
   %(prog)s --player charlie --date 2024-01-15 --time 180 --confirm
   %(prog)s --player alice --date 2024-01-15 --delete
   %(prog)s bob 2024-01-15 --delete
+  %(prog)s --batch times.csv --confirm
         """
     )
     
@@ -225,6 +413,11 @@ Examples:
         action='store_true',
         help='Delete the player\'s time for the selected date'
     )
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        help='CSV file of player,date,time rows to apply in one transaction'
+    )
     parser.add_argument(
         '--confirm',
         action='store_true',
@@ -233,6 +426,44 @@ Examples:
     
     args = parser.parse_args()
     
+    # If --batch is set, apply every row in the file at once
+    if args.batch:
+        single_edit_args = (
+            args.player, args.date, args.time,
+            args.player_flag, args.date_flag, args.time_flag,
+        )
+        if args.delete or any(value is not None for value in single_edit_args):
+            parser.error("--batch cannot be combined with player, date, time or --delete")
+        
+        try:
+            items = read_batch_file(args.batch)
+        except (OSError, ValueError) as e:
+            print(f"✗ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        
+        if not items:
+            print(f"No records found in {args.batch}")
+            print("Nothing to do.")
+            sys.exit(0)
+        
+        print(f"{len(items)} records will be written from {args.batch}")
+        
+        # Confirm unless --confirm flag is set
+        if not args.confirm:
+            response = input("\nProceed with these changes? (yes/no): ").strip().lower()
+            if response not in ('yes', 'y'):
+                print("Operation cancelled.")
+                sys.exit(0)
+        
+        success, message, _ = edit_times_bulk(items)
+        
+        if success:
+            print(f"\n✓ {message}")
+            sys.exit(0)
+        else:
+            print(f"\n✗ Error: {message}", file=sys.stderr)
+            sys.exit(1)
+    
     # Use flag arguments if provided, otherwise use positional arguments
     player = args.player_flag or args.player
     date = args.date_flag or args.date
@@ -244,29 +475,61 @@ Examples:
     if not date:
         parser.error("Date is required (use --date or positional argument)")
     
-    # If --delete is set, handle deletion
-    if args.delete:
-        # Get current time for confirmation
-        old_time = get_current_time(player, date)
+    if not args.delete and time_value is None:
+        parser.error("Time is required when not using --delete (use --time or positional argument)")
+    
+    # The preview and the change share one connection
+    conn = get_db_connection()
+    try:
+        # If --delete is set, handle deletion
+        if args.delete:
+            # Show what will happen
+            success, message, old_time = delete_time(player, date, preview=True, conn=conn)
+            
+            if not success:
+                print(f"✗ Error: {message}", file=sys.stderr)
+                sys.exit(1)
+            
+            print(message)
+            if old_time is None:
+                print("Nothing to delete.")
+                sys.exit(0)
+            
+            # Confirm unless --confirm flag is set
+            if not args.confirm:
+                response = input("\nProceed with deletion? (yes/no): ").strip().lower()
+                if response not in ('yes', 'y'):
+                    print("Operation cancelled.")
+                    sys.exit(0)
+            
+            # Perform the deletion
+            success, message, _ = delete_time(player, date, conn=conn)
+            
+            if success:
+                print(f"\n✓ {message}")
+                sys.exit(0)
+            else:
+                print(f"\n✗ Error: {message}", file=sys.stderr)
+                sys.exit(1)
         
-        # Show what will happen
-        if old_time is not None:
-            print(f"Current time for {player} on {date}: {old_time}")
-            print(f"This record will be deleted.")
-        else:
-            print(f"No existing record for {player} on {date}")
-            print("Nothing to delete.")
-            sys.exit(0)
+        # Otherwise, handle edit; show what will happen
+        success, message, _ = edit_time(player, date, time_value, preview=True, conn=conn)
+        
+        if not success:
+            print(f"✗ Error: {message}", file=sys.stderr)
+            sys.exit(1)
+        
+        print(message)
         
         # Confirm unless --confirm flag is set
         if not args.confirm:
-            response = input("\nProceed with deletion? (yes/no): ").strip().lower()
+            response = input("\nProceed with this change? (yes/no): ").strip().lower()
             if response not in ('yes', 'y'):
                 print("Operation cancelled.")
                 sys.exit(0)
         
-        # Perform the deletion
-        success, message, _ = delete_time(player, date)
+        # Perform the edit
+        success, message, _ = edit_time(player, date, time_value, conn=conn)
         
         if success:
             print(f"\n✓ {message}")
@@ -274,38 +537,8 @@ Examples:
         else:
             print(f"\n✗ Error: {message}", file=sys.stderr)
             sys.exit(1)
-    
-    # Otherwise, handle edit (time is required)
-    if time_value is None:
-        parser.error("Time is required when not using --delete (use --time or positional argument)")
-    
-    # Get current time for confirmation
-    old_time = get_current_time(player, date)
-    
-    # Show what will happen
-    if old_time is not None:
-        print(f"Current time for {player} on {date}: {old_time}")
-        print(f"New time: {time_value}")
-    else:
-        print(f"No existing record for {player} on {date}")
-        print(f"Will create new record with time: {time_value}")
-    
-    # Confirm unless --confirm flag is set
-    if not args.confirm:
-        response = input("\nProceed with this change? (yes/no): ").strip().lower()
-        if response not in ('yes', 'y'):
-            print("Operation cancelled.")
-            sys.exit(0)
-    
-    # Perform the edit
-    success, message, _ = edit_time(player, date, time_value)
-    
-    if success:
-        print(f"\n✓ {message}")
-        sys.exit(0)
-    else:
-        print(f"\n✗ Error: {message}", file=sys.stderr)
-        sys.exit(1)
+    finally:
+        conn.close()
 
 
 if __name__ == '__main__':